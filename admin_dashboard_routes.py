@@ -7,28 +7,222 @@ import os
 import json
 import logging
 import asyncio
+import hashlib
+import time
+from collections import deque
 from datetime import datetime
+from typing import Optional
 from aiohttp import web
 from aiohttp.web import Request, Response, json_response
 import aiohttp
 
+# Handle orjson import with fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from http_utils import FUNCTION_KEY_RE, compress_variants, variant_etags, variant_response
+
 # Import UI components
-from admin_dashboard_ui import get_admin_dashboard_html
+from admin_dashboard_ui import (
+    get_admin_dashboard_html,
+    get_admin_dashboard_javascript,
+    ADMIN_DASHBOARD_JS_HASH,
+    ADMIN_DASHBOARD_JS_PATH
+)
 
 logger = logging.getLogger(__name__)
 
+# The OpenAI probe body never changes, so encode it once
+_OPENAI_TEST_PAYLOAD = {
+    "messages": [{"role": "user", "content": "Test"}],
+    "max_tokens": 5
+}
+if ORJSON_AVAILABLE:
+    _OPENAI_TEST_BODY = orjson.dumps(_OPENAI_TEST_PAYLOAD)
+else:
+    _OPENAI_TEST_BODY = json.dumps(_OPENAI_TEST_PAYLOAD).encode('utf-8')
+
+# Same for the SQL function's metadata probe
+_FUNCTION_TEST_BODY = b'{"query_type": "metadata"}'
+_FUNCTION_TEST_HEADERS = {"Content-Type": "application/json"}
+
+# Bound each phase so a stalled DNS lookup or TLS handshake fails in ~2s
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2, sock_connect=2, sock_read=8)
+
+async def _read_error_preview(response: aiohttp.ClientResponse, limit: int = 512) -> str:
+    """Read just the start of an error body; the dashboard shows 200 characters of it"""
+    try:
+        raw = await response.content.readexactly(limit)
+    except asyncio.IncompleteReadError as e:
+        raw = e.partial
+    return raw.decode('utf-8', errors='replace')
+
+class UptimeTracker:
+    """Tracks process uptime and a bounded window of response-time samples per source"""
+    
+    MAX_SAMPLES = 1024
+    
+    def __init__(self):
+        self.start_time = datetime.now()
+        # Remote round-trips and local handler timings are kept apart so
+        # their stats are not averaged together
+        self.samples = {}
+    
+    def get_uptime(self) -> str:
+        """Get uptime as a string"""
+        return str(datetime.now() - self.start_time)
+    
+    def add_performance_sample(self, response_time_ms: float, source: str = "performance"):
+        """Record a response time; the oldest sample for the source is dropped when full"""
+        samples = self.samples.get(source)
+        if samples is None:
+            samples = self.samples[source] = deque(maxlen=self.MAX_SAMPLES)
+        samples.append(response_time_ms)
+    
+    def get_performance_stats(self) -> dict:
+        """Get avg/min/max/p95 over the retained samples, keyed by source"""
+        stats = {}
+        for source, samples in self.samples.items():
+            times = sorted(samples)
+            count = len(times)
+            stats[source] = {
+                "sample_count": count,
+                "avg_ms": round(sum(times) / count, 2),
+                "min_ms": round(times[0], 2),
+                "max_ms": round(times[-1], 2),
+                "p95_ms": round(times[min(count - 1, int(count * 0.95))], 2)
+            }
+        return stats
+
 class AdminDashboard:
     """Admin dashboard handler"""
     
-    def __init__(self, sql_translator=None):
+    MEMORY_CACHE_TTL = 1.0  # seconds
+    
+    def __init__(self, sql_translator=None, http_session_key=None):
         self.sql_translator = sql_translator
+        self.http_session_key = http_session_key
+        self._session = None
         self.function_url = os.environ.get("AZURE_FUNCTION_URL", "")
-        self.start_time = datetime.now()
+        self.function_auth_method = "url_embedded" if FUNCTION_KEY_RE.search(self.function_url) else "header"
+        self.uptime_tracker = UptimeTracker()
+        self.start_time = self.uptime_tracker.start_time
+        
+        # The page is static, so render and compress it once
+        self._page_variants = compress_variants(
+            get_admin_dashboard_html().encode('utf-8')
+        )
+        self._page_etags = variant_etags(
+            self._page_variants,
+            hashlib.sha256(self._page_variants["identity"]).hexdigest()[:16]
+        )
+        self._script_variants = compress_variants(
+            get_admin_dashboard_javascript().encode('utf-8')
+        )
+        self._script_etags = variant_etags(self._script_variants, ADMIN_DASHBOARD_JS_HASH)
+        
+        # psutil is imported on the first stats request, not at app import
+        self._proc = None
+        self._proc_loaded = False
+        self._mem_cache = None
+        
+        # Resolved OpenAI probe URL/headers, rebuilt only when the env changes
+        self._openai_cfg = None
+        self._openai_cfg_key = None
+    
+    def _get_session(self, request: Request) -> aiohttp.ClientSession:
+        """Get the app-wide client session, or the dashboard's own pooled one"""
+        if self.http_session_key is not None:
+            session = request.app.get(self.http_session_key)
+            if session is not None and not session.closed:
+                return session
+        
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def close(self, app=None):
+        """Close the dashboard's own client session, if one was opened"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    def _get_openai_config(self) -> Optional[dict]:
+        """Get the cached OpenAI probe config, or None if not configured"""
+        cfg_key = (
+            os.environ.get("AZURE_OPENAI_ENDPOINT"),
+            os.environ.get("AZURE_OPENAI_API_KEY"),
+            os.environ.get("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o-mini")
+        )
+        if cfg_key == self._openai_cfg_key:
+            return self._openai_cfg
+        
+        endpoint, api_key, deployment = cfg_key
+        if not endpoint or not api_key:
+            self._openai_cfg = None
+        else:
+            self._openai_cfg = {
+                "url": f"{endpoint.rstrip('/')}/openai/deployments/{deployment}/chat/completions?api-version=2024-02-01",
+                "headers": {
+                    "api-key": api_key,
+                    "Content-Type": "application/json"
+                },
+                "deployment": deployment
+            }
+        self._openai_cfg_key = cfg_key
+        return self._openai_cfg
+    
+    async def _get_memory_info(self) -> dict:
+        """Get process memory and CPU usage without blocking the event loop"""
+        if not self._proc_loaded:
+            await asyncio.get_running_loop().run_in_executor(None, self._load_process)
+        if self._proc is None:
+            return {"memory_usage_mb": 100, "info": "psutil not available"}
+        
+        # Concurrent dashboard polls within a second share one reading
+        now = time.monotonic()
+        if self._mem_cache and now - self._mem_cache[0] < self.MEMORY_CACHE_TTL:
+            return self._mem_cache[1]
+        
+        info = await asyncio.get_running_loop().run_in_executor(None, self._sync_memory_info)
+        self._mem_cache = (now, info)
+        return info
+    
+    def _load_process(self):
+        """Import psutil and keep one process handle (blocking)"""
+        # Prime cpu_percent, which returns 0.0 on its first call
+        try:
+            import psutil
+            self._proc = psutil.Process()
+            self._proc.cpu_percent(None)
+        except ImportError:
+            self._proc = None
+        self._proc_loaded = True
+    
+    def _sync_memory_info(self) -> dict:
+        """Read memory and CPU usage from psutil (blocking)"""
+        return {
+            "memory_usage_mb": round(self._proc.memory_info().rss / 1024 / 1024, 2),
+            "cpu_percent": round(self._proc.cpu_percent(None), 2)
+        }
     
     async def dashboard_page(self, request: Request) -> Response:
         """Serve the admin dashboard page"""
-        html_content = get_admin_dashboard_html()
-        return Response(text=html_content, content_type='text/html')
+        return variant_response(
+            request, self._page_variants, 'text/html',
+            etags=self._page_etags,
+            cache_control="private, max-age=60"
+        )
+    
+    async def dashboard_script(self, request: Request) -> Response:
+        """Serve the dashboard JavaScript; the URL is content-hashed so it never goes stale"""
+        return variant_response(
+            request, self._script_variants, 'application/javascript',
+            etags=self._script_etags,
+            cache_control="public, max-age=31536000, immutable"
+        )
     
     async def api_test_health(self, request: Request) -> Response:
         """API endpoint for health check"""
@@ -36,7 +230,7 @@ class AdminDashboard:
             health_data = {
                 "status": "healthy",
                 "version": "2.0.0",
-                "uptime": str(datetime.now() - self.start_time),
+                "uptime": self.uptime_tracker.get_uptime(),
                 "services": {
                     "sql_translator": self.sql_translator is not None,
                     "sql_function": bool(self.function_url),
@@ -60,7 +254,8 @@ class AdminDashboard:
     async def api_test_openai(self, request: Request) -> Response:
         """API endpoint for testing Azure OpenAI"""
         try:
-            if not os.environ.get("AZURE_OPENAI_ENDPOINT") or not os.environ.get("AZURE_OPENAI_API_KEY"):
+            openai_cfg = self._get_openai_config()
+            if openai_cfg is None:
                 return json_response({
                     "status": "error",
                     "data": {
@@ -69,58 +264,49 @@ class AdminDashboard:
                     }
                 })
             
-            endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT").rstrip('/')
-            api_key = os.environ.get("AZURE_OPENAI_API_KEY")
-            deployment = os.environ.get("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o-mini")
-            
-            test_url = f"{endpoint}/openai/deployments/{deployment}/chat/completions?api-version=2024-02-01"
+            deployment = openai_cfg["deployment"]
             
             start_time = asyncio.get_event_loop().time()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    test_url,
-                    headers={
-                        "api-key": api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "messages": [{"role": "user", "content": "Test"}],
-                        "max_tokens": 5
-                    },
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    
-                    end_time = asyncio.get_event_loop().time()
-                    response_time = (end_time - start_time) * 1000
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        return json_response({
-                            "status": "success",
-                            "data": {
-                                "success": True,
-                                "details": {
-                                    "deployment": deployment,
-                                    "model": data.get("model", "unknown"),
-                                    "response_time_ms": response_time,
-                                    "status_code": response.status
-                                }
+            session = self._get_session(request)
+            async with session.post(
+                openai_cfg["url"],
+                headers=openai_cfg["headers"],
+                data=_OPENAI_TEST_BODY,
+                timeout=_PROBE_TIMEOUT
+            ) as response:
+                
+                end_time = asyncio.get_event_loop().time()
+                response_time = (end_time - start_time) * 1000
+                self.uptime_tracker.add_performance_sample(response_time, "openai")
+                
+                if response.status == 200:
+                    data = await response.json()
+                    return json_response({
+                        "status": "success",
+                        "data": {
+                            "success": True,
+                            "details": {
+                                "deployment": deployment,
+                                "model": data.get("model", "unknown"),
+                                "response_time_ms": response_time,
+                                "status_code": response.status
                             }
-                        })
-                    else:
-                        error_text = await response.text()
-                        return json_response({
-                            "status": "error",
-                            "data": {
-                                "success": False,
-                                "error": f"API error: {response.status}",
-                                "details": {
-                                    "status_code": response.status,
-                                    "response": error_text[:200]
-                                }
+                        }
+                    })
+                else:
+                    error_text = await _read_error_preview(response)
+                    return json_response({
+                        "status": "error",
+                        "data": {
+                            "success": False,
+                            "error": f"API error: {response.status}",
+                            "details": {
+                                "status_code": response.status,
+                                "response": error_text[:200]
                             }
-                        })
+                        }
+                    })
                         
         except Exception as e:
             return json_response({
@@ -143,48 +329,47 @@ class AdminDashboard:
                     }
                 })
             
-            headers = {"Content-Type": "application/json"}
-            
             start_time = asyncio.get_event_loop().time()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.function_url,
-                    json={"query_type": "metadata"},
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    
-                    end_time = asyncio.get_event_loop().time()
-                    response_time = (end_time - start_time) * 1000
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        return json_response({
-                            "status": "success",
-                            "data": {
-                                "success": True,
-                                "details": {
-                                    "auth_method": "url_embedded" if "code=" in self.function_url else "header",
-                                    "databases_found": len(data.get("databases", [])),
-                                    "response_time_ms": response_time,
-                                    "sample_databases": data.get("databases", [])[:3]
-                                }
+            session = self._get_session(request)
+            async with session.post(
+                self.function_url,
+                data=_FUNCTION_TEST_BODY,
+                headers=_FUNCTION_TEST_HEADERS,
+                timeout=_PROBE_TIMEOUT
+            ) as response:
+                
+                end_time = asyncio.get_event_loop().time()
+                response_time = (end_time - start_time) * 1000
+                self.uptime_tracker.add_performance_sample(response_time, "function")
+                
+                if response.status == 200:
+                    data = await response.json()
+                    return json_response({
+                        "status": "success",
+                        "data": {
+                            "success": True,
+                            "details": {
+                                "auth_method": self.function_auth_method,
+                                "databases_found": len(data.get("databases", [])),
+                                "response_time_ms": response_time,
+                                "sample_databases": data.get("databases", [])[:3]
                             }
-                        })
-                    else:
-                        error_text = await response.text()
-                        return json_response({
-                            "status": "error",
-                            "data": {
-                                "success": False,
-                                "error": f"Function error: {response.status}",
-                                "details": {
-                                    "status_code": response.status,
-                                    "response": error_text[:200]
-                                }
+                        }
+                    })
+                else:
+                    error_text = await _read_error_preview(response)
+                    return json_response({
+                        "status": "error",
+                        "data": {
+                            "success": False,
+                            "error": f"Function error: {response.status}",
+                            "details": {
+                                "status_code": response.status,
+                                "response": error_text[:200]
                             }
-                        })
+                        }
+                    })
                         
         except Exception as e:
             return json_response({
@@ -232,30 +417,21 @@ class AdminDashboard:
     async def api_test_performance(self, request: Request) -> Response:
         """API endpoint for testing performance"""
         try:
-            start_time = asyncio.get_event_loop().time()
-            
-            # Simulate some work
-            await asyncio.sleep(0.001)
+            # Time the handler's own work rather than a sleep, which only
+            # measured event loop scheduling jitter
+            start_time = time.perf_counter()
             
-            end_time = asyncio.get_event_loop().time()
-            response_time = (end_time - start_time) * 1000
+            memory_info = await self._get_memory_info()
+            performance_stats = self.uptime_tracker.get_performance_stats()
             
-            # Get memory info if available
-            memory_info = {}
-            try:
-                import psutil
-                process = psutil.Process()
-                memory_info = {
-                    "memory_usage_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-                    "cpu_percent": round(process.cpu_percent(), 2)
-                }
-            except ImportError:
-                memory_info = {"memory_usage_mb": 100, "info": "psutil not available"}
+            response_time = (time.perf_counter() - start_time) * 1000
+            self.uptime_tracker.add_performance_sample(response_time)
             
             return json_response({
                 "status": "success",
                 "response_time_ms": round(response_time, 2),
-                "uptime": str(datetime.now() - self.start_time),
+                "uptime": self.uptime_tracker.get_uptime(),
+                "performance_stats": performance_stats,
                 **memory_info
             })
             
@@ -265,14 +441,16 @@ class AdminDashboard:
                 "error": str(e)
             }, status=500)
 
-def add_admin_routes(app, sql_translator=None):
+def add_admin_routes(app, sql_translator=None, http_session_key=None):
     """Add admin dashboard routes to the main app"""
     
-    dashboard = AdminDashboard(sql_translator)
+    dashboard = AdminDashboard(sql_translator, http_session_key)
+    app.on_cleanup.append(dashboard.close)
     
     # Dashboard page
     app.router.add_get('/admin', dashboard.dashboard_page)
     app.router.add_get('/admin/', dashboard.dashboard_page)
+    app.router.add_get(ADMIN_DASHBOARD_JS_PATH, dashboard.dashboard_script)
     
     # API endpoints
     app.router.add_get('/admin/api/health', dashboard.api_test_health)
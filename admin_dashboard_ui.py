@@ -3,6 +3,10 @@
 Admin Dashboard UI - Separated HTML, CSS, and JavaScript
 """
 
+import hashlib
+import html
+import string
+
 def get_admin_dashboard_css():
     """Return the CSS styles for the admin dashboard"""
     return '''
@@ -283,85 +287,242 @@ def get_admin_dashboard_javascript():
     """Return the JavaScript code for the admin dashboard"""
     return '''
     let testResults = {};
+    // Running tallies of testResults, kept in step by updateStatus
+    let statusCounts = { success: 0, error: 0, warning: 0, loading: 0, unknown: 0 };
+    let testCount = 0;
+    const lastDetails = {};
     let logs = [];
+    let logStart = 0;
     let isTestRunning = false;
+    let currentRunAbort = null;
+    const MAX_LOGS = 500;
+
+    // toLocaleTimeString builds a new formatter on every call; reuse one
+    const timeFmt = new Intl.DateTimeFormat(undefined, { hour: 'numeric', minute: '2-digit', second: '2-digit' });
+    let _pendingLogs = [], _raf = null;
+
+    // The page is static, so element lookups (including misses) are cached
+    const elCache = Object.create(null);
+    function $id(id) {
+        if (!(id in elCache)) {
+            elCache[id] = document.getElementById(id);
+        }
+        return elCache[id];
+    }
 
     function log(message, type = 'info') {
-        const timestamp = new Date().toLocaleTimeString();
-        logs.push({ timestamp, message, type });
-        
-        const logViewer = document.getElementById('logViewer');
-        const logEntry = document.createElement('div');
-        logEntry.className = `log-entry ${type}`;
-        logEntry.innerHTML = `
-            <span class="timestamp">[${timestamp}]</span>
-            <span class="message">${escapeHtml(message)}</span>
-        `;
-        logViewer.appendChild(logEntry);
+        const timestamp = timeFmt.format(Date.now());
+        const entry = { timestamp, message, type };
+
+        // Ring buffer: once full, overwrite the oldest entry in place
+        if (logs.length < MAX_LOGS) {
+            logs.push(entry);
+        } else {
+            logs[logStart] = entry;
+            logStart = (logStart + 1) % MAX_LOGS;
+        }
+
+        // Queue the entry; the DOM is touched once per animation frame.
+        // rAF is paused in hidden tabs, so the queue is capped as well.
+        if (_pendingLogs.length >= MAX_LOGS) {
+            _pendingLogs.shift();
+        }
+        _pendingLogs.push(entry);
+        if (_raf === null) {
+            _raf = requestAnimationFrame(flushLogs);
+        }
+    }
+
+    function orderedLogs() {
+        return logStart === 0 ? logs : logs.slice(logStart).concat(logs.slice(0, logStart));
+    }
+
+    function flushLogs() {
+        const logViewer = $id('logViewer');
+        const template = $id('logEntryTpl').content.firstElementChild;
+        const fragment = document.createDocumentFragment();
+
+        for (const entry of _pendingLogs) {
+            const logEntry = template.cloneNode(true);
+            logEntry.classList.add(entry.type);
+            logEntry.firstElementChild.textContent = `[${entry.timestamp}]`;
+            logEntry.lastElementChild.textContent = entry.message;
+            fragment.appendChild(logEntry);
+        }
+        _pendingLogs = [];
+        _raf = null;
+
+        logViewer.appendChild(fragment);
+        while (logViewer.childElementCount > MAX_LOGS) {
+            logViewer.removeChild(logViewer.firstElementChild);
+        }
         logViewer.scrollTop = logViewer.scrollHeight;
     }
 
-    function escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+    const STATUS_ICON = Object.freeze({
+        success: '✓',
+        error: '✗',
+        warning: '⚠',
+        loading: '⟳',
+        unknown: '?'
+    });
+
+    // Coalesce DOM writes per animation frame; a later write for the same
+    // key replaces the pending one
+    const pendingWrites = new Map();
+    let rafScheduled = false;
+
+    function scheduleWrite(key, fn) {
+        pendingWrites.set(key, fn);
+        if (!rafScheduled) {
+            rafScheduled = true;
+            requestAnimationFrame(flushWrites);
+        }
+    }
+
+    function flushWrites() {
+        for (const fn of pendingWrites.values()) {
+            fn();
+        }
+        pendingWrites.clear();
+        rafScheduled = false;
+    }
+
+    // Icon and details elements per test, resolved once from data-test
+    const testEls = {};
+
+    function indexTestElements() {
+        document.querySelectorAll('[data-test]').forEach(el => {
+            const test = el.dataset.test;
+            const entry = testEls[test] || (testEls[test] = { icon: null, details: null });
+            entry[el.classList.contains('status-icon') ? 'icon' : 'details'] = el;
+        });
     }
 
     function updateStatus(test, status, details = '') {
-        testResults[test] = status;
-        
-        const icon = document.getElementById(test + 'Icon');
-        if (icon) {
-            icon.className = `status-icon status-${status}`;
-            icon.textContent = status === 'success' ? '✓' : 
-                             status === 'error' ? '✗' : 
-                             status === 'warning' ? '⚠' : 
-                             status === 'loading' ? '⟳' : '?';
+        const previous = testResults[test];
+        if (previous === status && lastDetails[test] === details) {
+            return;
         }
+        lastDetails[test] = details;
         
-        const detailsEl = document.getElementById(test + 'Details');
-        if (detailsEl && details) {
-            detailsEl.textContent = details;
-            detailsEl.className = `test-result ${status}`;
+        if (previous === undefined) {
+            testCount++;
+        } else {
+            statusCounts[previous]--;
         }
+        statusCounts[status]++;
+        testResults[test] = status;
+        
+        scheduleWrite('status:' + test, () => {
+            const { icon, details: detailsEl } = testEls[test] || {};
+            if (icon) {
+                icon.className = `status-icon status-${status}`;
+                icon.textContent = STATUS_ICON[status] ?? '?';
+            }
+            
+            if (detailsEl && details) {
+                detailsEl.textContent = details;
+                detailsEl.className = `test-result ${status}`;
+            }
+        });
         
         updateOverallStatus();
     }
 
     function updateOverallStatus() {
-        const results = Object.values(testResults);
-        const passed = results.filter(r => r === 'success').length;
-        const failed = results.filter(r => r === 'error').length;
+        scheduleWrite('overall', renderOverallStatus);
+    }
+
+    const renderedOverall = { state: null, text: null };
+
+    function renderOverallStatus() {
+        const passed = statusCounts.success;
+        const failed = statusCounts.error;
         
-        const statusEl = document.getElementById('overallStatus');
-        const statusText = document.getElementById('overallStatusText');
+        const statusEl = $id('overallStatus');
+        const statusText = $id('overallStatusText');
         
-        if (results.length === 0) {
-            statusEl.className = 'status-icon status-unknown';
-            statusEl.textContent = '?';
-            statusText.textContent = 'No tests run';
+        let state, text;
+        if (testCount === 0) {
+            state = 'unknown';
+            text = 'No tests run';
         } else if (failed > 0) {
-            statusEl.className = 'status-icon status-error';
-            statusEl.textContent = '✗';
-            statusText.textContent = `${failed} test(s) failed`;
-        } else if (passed === results.length) {
-            statusEl.className = 'status-icon status-success';
-            statusEl.textContent = '✓';
-            statusText.textContent = 'All tests passed';
+            state = 'error';
+            text = `${failed} test(s) failed`;
+        } else if (passed === testCount) {
+            state = 'success';
+            text = 'All tests passed';
         } else {
-            statusEl.className = 'status-icon status-warning';
-            statusEl.textContent = '⚠';
-            statusText.textContent = `${passed}/${results.length} tests passed`;
+            state = 'warning';
+            text = `${passed}/${testCount} tests passed`;
+        }
+        
+        // Only write the parts that actually changed since the last render
+        if (state !== renderedOverall.state) {
+            statusEl.className = `status-icon status-${state}`;
+            statusEl.textContent = STATUS_ICON[state];
+            renderedOverall.state = state;
+        }
+        if (text !== renderedOverall.text) {
+            statusText.textContent = text;
+            renderedOverall.text = text;
         }
     }
 
-    async function makeApiCall(endpoint, method = 'GET', data = null) {
+    // Short-lived cache for GET results; performance is never cached since
+    // it measures latency
+    const apiCache = new Map();
+    const API_CACHE_TTL = {
+        '/health': 5000,
+        '/admin/api/openai': 5000,
+        '/admin/api/function': 5000,
+        '/admin/api/performance': 0,
+        default: 2000
+    };
+
+    // Longer than the server's own 10s probe timeout so its answer still arrives
+    const API_TIMEOUT_MS = 12000;
+
+    function withTimeout(signal, timeoutMs) {
+        if (AbortSignal.timeout && (!signal || AbortSignal.any)) {
+            const timeoutSignal = AbortSignal.timeout(timeoutMs);
+            return signal ? AbortSignal.any([signal, timeoutSignal]) : timeoutSignal;
+        }
+        
+        // Older browsers: one controller aborted by the run signal or a timer
+        const controller = new AbortController();
+        const timer = setTimeout(
+            () => controller.abort(new DOMException('signal timed out', 'TimeoutError')),
+            timeoutMs
+        );
+        controller.signal.addEventListener('abort', () => clearTimeout(timer), { once: true });
+        if (signal) {
+            if (signal.aborted) {
+                controller.abort(signal.reason);
+            } else {
+                signal.addEventListener('abort', () => controller.abort(signal.reason), { once: true });
+            }
+        }
+        return controller.signal;
+    }
+
+    async function makeApiCall(endpoint, method = 'GET', data = null, signal = undefined, timeoutMs = API_TIMEOUT_MS) {
+        const ttl = API_CACHE_TTL[endpoint] ?? API_CACHE_TTL.default;
+        if (method === 'GET' && ttl > 0) {
+            const hit = apiCache.get(endpoint);
+            if (hit && Date.now() - hit.ts < ttl) {
+                return structuredClone(hit.data);
+            }
+        }
+        
         try {
             const options = {
                 method: method,
                 headers: {
                     'Content-Type': 'application/json'
-                }
+                },
+                signal: withTimeout(signal, timeoutMs)
             };
             
             if (data) {
@@ -370,8 +531,20 @@ def get_admin_dashboard_javascript():
             
             const response = await fetch(endpoint, options);
             const result = await response.json();
+            if (method === 'GET' && ttl > 0 && response.ok && result.status !== 'error') {
+                apiCache.set(endpoint, { ts: Date.now(), data: structuredClone(result) });
+            }
             return result;
         } catch (error) {
+            if (error.name === 'AbortError') {
+                throw error;
+            }
+            if (error.name === 'TimeoutError') {
+                return {
+                    status: 'error',
+                    error: `Request timed out after ${timeoutMs}ms`
+                };
+            }
             return {
                 status: 'error',
                 error: error.message
@@ -379,12 +552,12 @@ def get_admin_dashboard_javascript():
         }
     }
 
-    async function testHealth() {
+    async function testHealth(signal) {
         updateStatus('health', 'loading');
         log('Testing system health...');
         
         try {
-            const result = await makeApiCall('/health');
+            const result = await makeApiCall('/health', 'GET', null, signal);
             
             if (result.status === 'healthy') {
                 const details = `Version: ${result.version}\\nServices: ${JSON.stringify(result.services, null, 2)}`;
@@ -395,20 +568,24 @@ def get_admin_dashboard_javascript():
                 log(`❌ Health check failed: ${result.error}`, 'error');
             }
         } catch (error) {
+            if (error.name === 'AbortError') {
+                return;
+            }
             updateStatus('health', 'error', error.message);
             log(`❌ Health check error: ${error.message}`, 'error');
         }
     }
 
-    async function testOpenAI() {
+    async function testOpenAI(signal) {
         updateStatus('openai', 'loading');
         log('Testing Azure OpenAI connection...');
         
         try {
-            const result = await makeApiCall('/admin/api/openai');
+            const result = await makeApiCall('/admin/api/openai', 'GET', null, signal);
             
             if (result.status === 'success' && result.data.success) {
-                const details = `Deployment: ${result.data.details.deployment}\\nModel: ${result.data.details.model}\\nResponse Time: ${result.data.details.response_time_ms}ms`;
+                const { deployment, model, response_time_ms } = result.data.details;
+                const details = `Deployment: ${deployment}\\nModel: ${model}\\nResponse Time: ${response_time_ms}ms`;
                 updateStatus('openai', 'success', details);
                 log('✅ Azure OpenAI connection successful', 'success');
             } else {
@@ -417,41 +594,48 @@ def get_admin_dashboard_javascript():
                 log(`❌ Azure OpenAI test failed: ${error}`, 'error');
             }
         } catch (error) {
+            if (error.name === 'AbortError') {
+                return;
+            }
             updateStatus('openai', 'error', error.message);
             log(`❌ OpenAI test error: ${error.message}`, 'error');
         }
     }
 
-    async function testSQLFunction() {
+    async function testSQLFunction(signal) {
         updateStatus('sqlFunction', 'loading');
         log('Testing SQL Function...');
         
         try {
-            const result = await makeApiCall('/admin/api/function');
+            const result = await makeApiCall('/admin/api/function', 'GET', null, signal);
             
             if (result.status === 'success' && result.data.success) {
-                const details = `Auth Method: ${result.data.details.auth_method}\\nDatabases: ${result.data.details.databases_found}\\nResponse Time: ${result.data.details.response_time_ms}ms`;
+                const { auth_method, databases_found, response_time_ms } = result.data.details;
+                const details = `Auth Method: ${auth_method}\\nDatabases: ${databases_found}\\nResponse Time: ${response_time_ms}ms`;
                 updateStatus('sqlFunction', 'success', details);
-                log(`✅ SQL Function connected - ${result.data.details.databases_found} databases found`, 'success');
+                log(`✅ SQL Function connected - ${databases_found} databases found`, 'success');
             } else {
                 const error = result.data ? result.data.error : result.error;
                 updateStatus('sqlFunction', 'error', error);
                 log(`❌ SQL Function test failed: ${error}`, 'error');
             }
         } catch (error) {
+            if (error.name === 'AbortError') {
+                return;
+            }
             updateStatus('sqlFunction', 'error', error.message);
             log(`❌ Function test error: ${error.message}`, 'error');
         }
     }
 
-    async function testTranslator() {
+    async function testTranslator(signal) {
         updateStatus('translator', 'loading');
         log('Testing SQL Translator...');
         
         try {
             const result = await makeApiCall('/admin/api/translator', 'POST', {
                 query: 'show me all tables'
-            });
+            }, signal);
             
             if (result.status === 'success') {
                 const details = `Query: ${result.query}\\nDatabase: ${result.database}\\nConfidence: ${result.confidence}`;
@@ -462,23 +646,29 @@ def get_admin_dashboard_javascript():
                 log(`❌ SQL Translator test failed: ${result.error}`, 'error');
             }
         } catch (error) {
+            if (error.name === 'AbortError') {
+                return;
+            }
             updateStatus('translator', 'error', error.message);
             log(`❌ Translator test error: ${error.message}`, 'error');
         }
     }
 
-    async function testPerformance() {
+    async function testPerformance(signal) {
         updateStatus('performance', 'loading');
         log('Testing performance...');
         
         try {
             const start = performance.now();
-            const result = await makeApiCall('/admin/api/performance');
+            const result = await makeApiCall('/admin/api/performance', 'GET', null, signal, 3000);
             const end = performance.now();
             const clientLatency = Math.round(end - start);
             
             if (result.status === 'success') {
-                const details = `Client Latency: ${clientLatency}ms\\nServer Time: ${result.response_time_ms}ms\\nMemory: ${result.memory_usage_mb}MB`;
+                let details = `Client Latency: ${clientLatency}ms\\nServer Time: ${result.response_time_ms}ms\\nMemory: ${result.memory_usage_mb}MB`;
+                for (const [source, stats] of Object.entries(result.performance_stats || {})) {
+                    details += `\\n${source} avg/P95 (${stats.sample_count} samples): ${stats.avg_ms}ms / ${stats.p95_ms}ms`;
+                }
                 updateStatus('performance', 'success', details);
                 log(`✅ Performance test: ${clientLatency}ms latency`, 'success');
             } else {
@@ -486,6 +676,9 @@ def get_admin_dashboard_javascript():
                 log(`❌ Performance test failed: ${result.error}`, 'error');
             }
         } catch (error) {
+            if (error.name === 'AbortError') {
+                return;
+            }
             updateStatus('performance', 'error', error.message);
             log(`❌ Performance test error: ${error.message}`, 'error');
         }
@@ -500,35 +693,27 @@ def get_admin_dashboard_javascript():
         isTestRunning = true;
         log('🚀 Starting comprehensive test suite...', 'info');
         
-        const runButton = document.getElementById('runAllTestsBtn');
+        const runButton = $id('runAllTestsBtn');
         if (runButton) {
             runButton.disabled = true;
-            runButton.innerHTML = '<span class="spinner"></span> Running Tests...';
+            $id('runAllSpinner').style.display = '';
+            $id('runAllLabel').textContent = 'Running Tests...';
         }
         
-        // Reset all test statuses
-        ['health', 'openai', 'sqlFunction', 'translator', 'performance'].forEach(test => {
-            updateStatus(test, 'loading');
-        });
-        
-        // Run tests sequentially
-        await testHealth();
-        await new Promise(resolve => setTimeout(resolve, 300));
-        
-        await testOpenAI();
-        await new Promise(resolve => setTimeout(resolve, 300));
-        
-        await testSQLFunction();
-        await new Promise(resolve => setTimeout(resolve, 300));
+        // The tests hit independent endpoints, so run them concurrently
+        currentRunAbort = new AbortController();
+        const signal = currentRunAbort.signal;
+        await Promise.allSettled([
+            testHealth(signal),
+            testOpenAI(signal),
+            testSQLFunction(signal),
+            testTranslator(signal),
+            testPerformance(signal)
+        ]);
+        currentRunAbort = null;
         
-        await testTranslator();
-        await new Promise(resolve => setTimeout(resolve, 300));
-        
-        await testPerformance();
-        
-        const results = Object.values(testResults);
-        const passed = results.filter(r => r === 'success').length;
-        const total = results.length;
+        const passed = statusCounts.success;
+        const total = testCount;
         
         if (passed === total) {
             log('🎉 All tests passed! System is fully operational.', 'success');
@@ -538,7 +723,8 @@ def get_admin_dashboard_javascript():
         
         if (runButton) {
             runButton.disabled = false;
-            runButton.innerHTML = '🚀 Run All Tests';
+            $id('runAllSpinner').style.display = 'none';
+            $id('runAllLabel').textContent = '🚀 Run All Tests';
         }
         
         isTestRunning = false;
@@ -546,44 +732,80 @@ def get_admin_dashboard_javascript():
 
     function clearLogs() {
         logs = [];
-        document.getElementById('logViewer').innerHTML = '';
+        logStart = 0;
+        _pendingLogs = [];
+        $id('logViewer').replaceChildren();
         log('Logs cleared', 'info');
     }
 
-    function exportLogs() {
-        const logText = logs.map(log => `[${log.timestamp}] ${log.type.toUpperCase()}: ${log.message}`).join('\\n');
-        const blob = new Blob([logText], { type: 'text/plain' });
-        const url = URL.createObjectURL(blob);
-        
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = `admin-logs-${new Date().toISOString().split('T')[0]}.txt`;
+    function downloadFile(filename, parts, type) {
+        // The Blob takes the parts as-is, so no joined copy of the payload is built
+        const url = URL.createObjectURL(new Blob(parts, { type }));
+        const a = Object.assign(document.createElement('a'), { href: url, download: filename });
         document.body.appendChild(a);
         a.click();
         document.body.removeChild(a);
         URL.revokeObjectURL(url);
+    }
+
+    function exportLogs() {
+        const lines = orderedLogs().map(log => `[${log.timestamp}] ${log.type.toUpperCase()}: ${log.message}\\n`);
+        downloadFile(`admin-logs-${new Date().toISOString().split('T')[0]}.txt`, lines, 'text/plain');
         
         log('📥 Logs exported to file', 'success');
     }
 
+    const TEST_RUNNERS = {
+        health: testHealth,
+        openai: testOpenAI,
+        sqlFunction: testSQLFunction,
+        translator: testTranslator,
+        performance: testPerformance
+    };
+
+    // One delegated listener handles every button on the page
+    document.addEventListener('click', event => {
+        const target = event.target.closest('[data-action]');
+        if (!target) {
+            return;
+        }
+        
+        switch (target.dataset.action) {
+            case 'test':
+                return TEST_RUNNERS[target.dataset.run]?.();
+            case 'runAll':
+                return runAllTests();
+            case 'reload':
+                return window.location.reload();
+            case 'clearLogs':
+                return clearLogs();
+            case 'exportLogs':
+                return exportLogs();
+        }
+    });
+
+    // Cancel an in-flight test run when the page goes away
+    window.addEventListener('beforeunload', () => currentRunAbort?.abort());
+
     // Initialize on page load
     document.addEventListener('DOMContentLoaded', function() {
+        indexTestElements();
         log('🚀 Admin dashboard initialized', 'success');
         log('💡 Click "Run All Tests" to check system status', 'info');
         updateOverallStatus();
     });
     '''
 
-def get_admin_dashboard_html(user_name="Admin"):
-    """Generate the admin dashboard HTML"""
-    return f'''<!DOCTYPE html>
+# The page shell is parsed once; only the $-slots are filled per render.
+# CSS goes in as a value; the JS is served separately (see below).
+_ADMIN_DASHBOARD_TEMPLATE = string.Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>SQL Assistant - Admin Dashboard</title>
     <style>
-        {get_admin_dashboard_css()}
+        $css
     </style>
 </head>
 <body>
@@ -591,7 +813,7 @@ def get_admin_dashboard_html(user_name="Admin"):
         <!-- Header -->
         <div class="header">
             <h1>🤖 SQL Assistant Admin Dashboard</h1>
-            <p>System Monitoring & Testing • Welcome, {user_name}</p>
+            <p>System Monitoring & Testing • Welcome, $user_name</p>
         </div>
 
         <!-- Quick Status Overview -->
@@ -605,7 +827,7 @@ def get_admin_dashboard_html(user_name="Admin"):
             </div>
             
             <div class="status-card">
-                <div class="status-icon status-unknown" id="healthIcon">?</div>
+                <div class="status-icon status-unknown" id="healthIcon" data-test="health">?</div>
                 <div class="status-info">
                     <h3>Health Check</h3>
                     <p>Application health status</p>
@@ -613,7 +835,7 @@ def get_admin_dashboard_html(user_name="Admin"):
             </div>
             
             <div class="status-card">
-                <div class="status-icon status-unknown" id="openaiIcon">?</div>
+                <div class="status-icon status-unknown" id="openaiIcon" data-test="openai">?</div>
                 <div class="status-info">
                     <h3>Azure OpenAI</h3>
                     <p>Translation service</p>
@@ -632,9 +854,9 @@ def get_admin_dashboard_html(user_name="Admin"):
                         <h4>System Health</h4>
                         <p class="test-status">Check overall system status</p>
                     </div>
-                    <button class="button secondary" onclick="testHealth()">Test</button>
+                    <button class="button secondary" data-action="test" data-run="health">Test</button>
                 </div>
-                <div id="healthDetails" class="test-result" style="display: none;"></div>
+                <div id="healthDetails" class="test-result" data-test="health" style="display: none;"></div>
 
                 <!-- OpenAI Test -->
                 <div class="test-item">
@@ -642,9 +864,9 @@ def get_admin_dashboard_html(user_name="Admin"):
                         <h4>Azure OpenAI</h4>
                         <p class="test-status">Test AI translation service</p>
                     </div>
-                    <button class="button secondary" onclick="testOpenAI()">Test</button>
+                    <button class="button secondary" data-action="test" data-run="openai">Test</button>
                 </div>
-                <div id="openaiDetails" class="test-result" style="display: none;"></div>
+                <div id="openaiDetails" class="test-result" data-test="openai" style="display: none;"></div>
 
                 <!-- SQL Function Test -->
                 <div class="test-item">
@@ -652,9 +874,9 @@ def get_admin_dashboard_html(user_name="Admin"):
                         <h4>SQL Function</h4>
                         <p class="test-status">Test database connection</p>
                     </div>
-                    <button class="button secondary" onclick="testSQLFunction()">Test</button>
+                    <button class="button secondary" data-action="test" data-run="sqlFunction">Test</button>
                 </div>
-                <div id="sqlFunctionDetails" class="test-result" style="display: none;"></div>
+                <div id="sqlFunctionDetails" class="test-result" data-test="sqlFunction" style="display: none;"></div>
 
                 <!-- Translator Test -->
                 <div class="test-item">
@@ -662,9 +884,9 @@ def get_admin_dashboard_html(user_name="Admin"):
                         <h4>SQL Translator</h4>
                         <p class="test-status">Test query translation</p>
                     </div>
-                    <button class="button secondary" onclick="testTranslator()">Test</button>
+                    <button class="button secondary" data-action="test" data-run="translator">Test</button>
                 </div>
-                <div id="translatorDetails" class="test-result" style="display: none;"></div>
+                <div id="translatorDetails" class="test-result" data-test="translator" style="display: none;"></div>
 
                 <!-- Performance Test -->
                 <div class="test-item">
@@ -672,14 +894,14 @@ def get_admin_dashboard_html(user_name="Admin"):
                         <h4>Performance</h4>
                         <p class="test-status">Test response times</p>
                     </div>
-                    <button class="button secondary" onclick="testPerformance()">Test</button>
+                    <button class="button secondary" data-action="test" data-run="performance">Test</button>
                 </div>
-                <div id="performanceDetails" class="test-result" style="display: none;"></div>
+                <div id="performanceDetails" class="test-result" data-test="performance" style="display: none;"></div>
             </div>
 
             <div class="button-group">
-                <button id="runAllTestsBtn" class="button primary" onclick="runAllTests()">🚀 Run All Tests</button>
-                <button class="button secondary" onclick="window.location.reload()">🔄 Refresh Page</button>
+                <button id="runAllTestsBtn" class="button primary" data-action="runAll"><span id="runAllSpinner" class="spinner" style="display: none;"></span> <span id="runAllLabel">🚀 Run All Tests</span></button>
+                <button class="button secondary" data-action="reload">🔄 Refresh Page</button>
                 <a href="/console" class="button secondary" style="text-decoration: none; display: inline-block;">💻 Open Console</a>
             </div>
         </div>
@@ -689,16 +911,31 @@ def get_admin_dashboard_html(user_name="Admin"):
             <div class="log-header">
                 <h2>📋 Activity Log</h2>
                 <div>
-                    <button class="button secondary" onclick="clearLogs()">Clear</button>
-                    <button class="button secondary" onclick="exportLogs()">Export</button>
+                    <button class="button secondary" data-action="clearLogs">Clear</button>
+                    <button class="button secondary" data-action="exportLogs">Export</button>
                 </div>
             </div>
             <div class="log-viewer" id="logViewer"></div>
+            <template id="logEntryTpl"><div class="log-entry"><span class="timestamp"></span><span class="message"></span></div></template>
         </div>
     </div>
 
-    <script>
-        {get_admin_dashboard_javascript()}
-    </script>
+    <script src="$script_src" defer></script>
 </body>
-</html>'''
\ No newline at end of file
+</html>''')
+
+_ADMIN_DASHBOARD_CSS = get_admin_dashboard_css()
+_ADMIN_DASHBOARD_JAVASCRIPT = get_admin_dashboard_javascript()
+
+# The script is served as its own asset under a content-hashed name so
+# browsers can cache it indefinitely and the page stays small
+ADMIN_DASHBOARD_JS_HASH = hashlib.sha256(_ADMIN_DASHBOARD_JAVASCRIPT.encode('utf-8')).hexdigest()[:12]
+ADMIN_DASHBOARD_JS_PATH = f"/admin/static/dashboard.{ADMIN_DASHBOARD_JS_HASH}.js"
+
+def get_admin_dashboard_html(user_name="Admin"):
+    """Generate the admin dashboard HTML"""
+    return _ADMIN_DASHBOARD_TEMPLATE.substitute(
+        css=_ADMIN_DASHBOARD_CSS,
+        script_src=ADMIN_DASHBOARD_JS_PATH,
+        user_name=html.escape(user_name)
+    )
@@ -13,6 +13,19 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+def _keyword_pattern(*terms: str) -> re.Pattern:
+    """Compile keywords into one alternation so a query is scanned once per group"""
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+# Intent keyword groups (substring matches against the lowercased query)
+_CURRENT_PERIOD_TERMS = _keyword_pattern("today", "yesterday", "this week", "this month")
+_PREVIOUS_PERIOD_TERMS = _keyword_pattern("last month", "last quarter", "last year")
+_YTD_TERMS = _keyword_pattern("ytd", "year to date")
+_REVENUE_TERMS = _keyword_pattern("revenue", "sales", "income")
+_CUSTOMER_TERMS = _keyword_pattern("customer", "client", "satisfaction", "nps")
+_OPERATIONS_TERMS = _keyword_pattern("cost", "expense", "efficiency", "productivity")
+_COMPARISON_TERMS = _keyword_pattern("compare", "vs", "versus", "comparison")
+
 @dataclass
 class AnalysisContext:
     """Context for an analysis session"""
@@ -350,24 +363,24 @@ class AnalysisAgent:
         time_context = None
         
         # Time context detection
-        if any(term in query_lower for term in ["today", "yesterday", "this week", "this month"]):
+        if _CURRENT_PERIOD_TERMS.search(query_lower):
             time_context = "current_period"
-        elif any(term in query_lower for term in ["last month", "last quarter", "last year"]):
+        elif _PREVIOUS_PERIOD_TERMS.search(query_lower):
             time_context = "previous_period"
-        elif any(term in query_lower for term in ["ytd", "year to date"]):
+        elif _YTD_TERMS.search(query_lower):
             time_context = "year_to_date"
         
         # Focus area detection
-        if any(term in query_lower for term in ["revenue", "sales", "income"]):
+        if _REVENUE_TERMS.search(query_lower):
             focus_areas.append("revenue")
             query_type = "financial"
-        if any(term in query_lower for term in ["customer", "client", "satisfaction", "nps"]):
+        if _CUSTOMER_TERMS.search(query_lower):
             focus_areas.append("customer")
             query_type = "customer"
-        if any(term in query_lower for term in ["cost", "expense", "efficiency", "productivity"]):
+        if _OPERATIONS_TERMS.search(query_lower):
             focus_areas.append("operations")
             query_type = "operational"
-        if any(term in query_lower for term in ["compare", "vs", "versus", "comparison"]):
+        if _COMPARISON_TERMS.search(query_lower):
             query_type = "comparison"
         
         # Find matching patterns
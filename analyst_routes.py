@@ -15,7 +15,7 @@ from aiohttp.web import Request, Response, json_response
 import aiohttp
 
 # Import components
-from powerbi_client import powerbi_client, WorkspaceInfo, DatasetInfo, QueryResult
+from powerbi_client import powerbi_client, WorkspaceInfo, DatasetInfo, QueryResult, PROBE_TIMEOUT
 from analyst_translator import analyst_translator, DAXQuery, TranslationContext
 from analysis_agent import analysis_agent, AnalysisContext, InsightResult
 
@@ -119,37 +119,34 @@ class PowerBIAnalyst:
                 # Try to list datasets directly to see if we have any access
                 try:
                     # Make a direct call to datasets endpoint
-                    headers = {
-                        "Authorization": f"Bearer {token}",
-                        "Content-Type": "application/json"
-                    }
+                    headers = self.powerbi_client.get_auth_headers(token)
                     
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            f"{self.powerbi_client.base_url}/datasets",
-                            headers=headers,
-                            timeout=aiohttp.ClientTimeout(total=10)
-                        ) as response:
+                    session = self.powerbi_client.get_session()
+                    async with session.get(
+                        f"{self.powerbi_client.base_url}/datasets",
+                        headers=headers,
+                        timeout=PROBE_TIMEOUT
+                    ) as response:
+                        
+                        if response.status == 200:
+                            data = await response.json()
+                            personal_datasets = data.get("value", [])
                             
-                            if response.status == 200:
-                                data = await response.json()
-                                personal_datasets = data.get("value", [])
-                                
-                                if personal_datasets:
-                                    logger.info(f"Found {len(personal_datasets)} datasets in personal workspace")
-                                    # Add a virtual "My Workspace" entry
-                                    workspace_list.append({
-                                        "id": "me",
-                                        "name": "My Workspace",
-                                        "description": "Personal workspace",
-                                        "is_personal": True,
-                                        "type": "Personal"
-                                    })
-                                else:
-                                    logger.info("No datasets found in personal workspace either")
+                            if personal_datasets:
+                                logger.info(f"Found {len(personal_datasets)} datasets in personal workspace")
+                                # Add a virtual "My Workspace" entry
+                                workspace_list.append({
+                                    "id": "me",
+                                    "name": "My Workspace",
+                                    "description": "Personal workspace",
+                                    "is_personal": True,
+                                    "type": "Personal"
+                                })
                             else:
-                                logger.warning(f"Could not check personal datasets: Status {response.status}")
-                                
+                                logger.info("No datasets found in personal workspace either")
+                        else:
+                            logger.warning(f"Could not check personal datasets: Status {response.status}")
+                            
                 except Exception as e:
                     logger.error(f"Error checking personal workspace: {e}")
             
@@ -690,6 +687,8 @@ def add_analyst_routes(app, sql_translator=None):
     """Add Power BI Analyst routes to the application"""
     
     analyst = PowerBIAnalyst()
+    app.on_startup.append(analyst.powerbi_client.warm_up)
+    app.on_cleanup.append(analyst.powerbi_client.close)
     
     # Main page
     app.router.add_get('/analyst', analyst.analyst_page)
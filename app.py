@@ -8,21 +8,49 @@ Better error handling and module loading diagnostics
 import os
 import json
 import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import sys
 import traceback
 
 # Web framework
 from aiohttp import web
-from aiohttp.web import Request, Response, json_response, middleware
+from aiohttp.web import Request, Response
 import aiohttp
 
-# Configure logging
+from http_utils import FUNCTION_KEY_RE
+
+# Handle orjson import with fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configure logging; records are queued and written by a listener thread so
+# log I/O never runs on the event loop
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The listener's handler adds the timestamp/level prefix; the queue side only
+# renders the message (and any traceback)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
@@ -45,8 +73,40 @@ LOADED_FEATURES = {
 # Track import errors
 IMPORT_ERRORS = {}
 
+def _json_bytes(data: Any) -> bytes:
+    """Encode data as UTF-8 JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def json_response(data: Any, *, status: int = 200, **kwargs) -> Response:
+    """JSON response built from pre-encoded bytes"""
+    return Response(
+        body=_json_bytes(data),
+        status=status,
+        content_type='application/json',
+        charset='utf-8',
+        **kwargs
+    )
+
+@dataclass(frozen=True)
+class EnvStatus:
+    """Environment configuration, checked once for the process lifetime"""
+    missing_vars: List[str]
+    powerbi_status: Dict[str, bool]
+    powerbi_configured: bool
+    function_configured: bool
+    has_embedded_auth: bool
+    powerbi_config: Dict[str, bool]  # static part of the /health powerbi_config section
+
+def _display_value(var: str, value: str) -> str:
+    """Log-safe form of an environment value: secrets keep only their first/last 4 chars"""
+    if "KEY" in var or "PASSWORD" in var or "SECRET" in var:
+        return value[:4] + "***" + value[-4:] if len(value) > 8 else "***"
+    return f"{value[:30]}..."
+
 # Check environment variables
-def check_environment():
+def check_environment() -> EnvStatus:
     """Check and log environment variable status"""
     required_vars = {
         "AZURE_OPENAI_ENDPOINT": "Azure OpenAI Endpoint",
@@ -71,11 +131,7 @@ def check_environment():
     for var, description in required_vars.items():
         value = os.environ.get(var)
         if value:
-            if "KEY" in var or "PASSWORD" in var or "SECRET" in var:
-                masked = value[:4] + "***" + value[-4:] if len(value) > 8 else "***"
-                logger.info(f"✓ {var}: {masked}")
-            else:
-                logger.info(f"✓ {var}: {value[:30]}...")
+            logger.info(f"✓ {var}: {_display_value(var, value)}")
         else:
             logger.error(f"❌ {var}: NOT SET ({description})")
             missing_vars.append(var)
@@ -86,11 +142,7 @@ def check_environment():
         value = os.environ.get(var)
         if value:
             powerbi_status[var] = True
-            if "SECRET" in var:
-                masked = value[:4] + "***" + value[-4:] if len(value) > 8 else "***"
-                logger.info(f"✓ {var}: {masked}")
-            else:
-                logger.info(f"✓ {var}: {value[:30]}...")
+            logger.info(f"✓ {var}: {_display_value(var, value)}")
         else:
             powerbi_status[var] = False
             logger.info(f"ℹ️ {var}: NOT SET ({description})")
@@ -98,7 +150,8 @@ def check_environment():
     
     # Check if URL has embedded authentication
     function_url = os.environ.get("AZURE_FUNCTION_URL", "")
-    if function_url and "code=" in function_url:
+    has_embedded_auth = bool(FUNCTION_KEY_RE.search(function_url))
+    if has_embedded_auth:
         logger.info("✅ Azure Function authentication: URL-embedded (recommended)")
     
     # Power BI status
@@ -110,52 +163,68 @@ def check_environment():
     else:
         logger.info("ℹ️ Power BI Analyst: Not configured (optional feature)")
     
-    return missing_vars, powerbi_status
+    return EnvStatus(
+        missing_vars=missing_vars,
+        powerbi_status=powerbi_status,
+        powerbi_configured=all_powerbi_configured,
+        function_configured=bool(function_url),
+        has_embedded_auth=has_embedded_auth,
+        powerbi_config={
+            "tenant_id_set": powerbi_status["POWERBI_TENANT_ID"],
+            "client_id_set": powerbi_status["POWERBI_CLIENT_ID"],
+            "client_secret_set": powerbi_status["POWERBI_CLIENT_SECRET"],
+            "all_configured": all_powerbi_configured
+        }
+    )
 
-# Run environment check
-missing_vars, powerbi_status = check_environment()
+# Run environment check; the environment is fixed for the process lifetime
+ENV_STATUS = check_environment()
 
-# Error handling middleware
-@middleware
-async def aiohttp_error_middleware(request: Request, handler):
-    """Global error handler for aiohttp"""
-    try:
-        response = await handler(request)
-        return response
-    except web.HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Unhandled error: {e}", exc_info=True)
-        return json_response({
-            "error": "Internal server error",
-            "message": str(e),
-            "type": type(e).__name__
-        }, status=500)
+# Error handling for handlers without their own try/except; the feature
+# modules' handlers catch their own errors, so no global middleware is needed
+def catch_errors(handler):
+    """Wrap a handler so unhandled errors become a JSON 500 response"""
+    @functools.wraps(handler)
+    async def wrapper(request: Request) -> Response:
+        try:
+            return await handler(request)
+        except web.HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unhandled error: {e}", exc_info=True)
+            return json_response({
+                "error": "Internal server error",
+                "message": str(e),
+                "type": type(e).__name__
+            }, status=500)
+    return wrapper
 
-# Initialize SQL translator if available
+# SQL translator is built in the background after startup (see init_sql_translator)
 SQL_TRANSLATOR = None
-if not missing_vars or all(var not in missing_vars for var in ["AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_API_KEY"]):
-    try:
-        # Import the unified SQL translator
-        from sql_translator import SQLTranslator
-        SQL_TRANSLATOR = SQLTranslator()
-        logger.info("✓ Unified SQL Translator initialized with error analysis")
-        LOADED_FEATURES["sql_translator"] = True
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize SQL Translator: {e}")
-        IMPORT_ERRORS["sql_translator"] = str(e)
+TRANSLATOR_CONFIGURED = all(
+    var not in ENV_STATUS.missing_vars for var in ["AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_API_KEY"]
+)
+TRANSLATOR_INIT = web.AppKey("translator_init", asyncio.Task)
+
+# Components that receive the translator once it is ready
+ADMIN_DASHBOARD = None
+SQL_CONSOLE = None
+
+# Shared outbound HTTP session, created in on_startup and closed in on_cleanup
+HTTP_SESSION = web.AppKey("http_session", aiohttp.ClientSession)
+
+# Health payloads are rebuilt and encoded at most once per TTL; monitors poll /health often
+_HEALTH_TTL = 10.0
+_HEALTH_CACHE = {"ts": 0.0, "body": None}
 
 # Health check endpoint
 async def health(req: Request) -> Response:
     """Health check endpoint"""
+    now = time.monotonic()
+    if _HEALTH_CACHE["body"] and now - _HEALTH_CACHE["ts"] < _HEALTH_TTL:
+        return Response(body=_HEALTH_CACHE["body"], content_type='application/json', charset='utf-8')
+    
     try:
-        # Check actual Power BI configuration status
-        powerbi_configured = all([
-            os.environ.get("POWERBI_TENANT_ID"),
-            os.environ.get("POWERBI_CLIENT_ID"),
-            os.environ.get("POWERBI_CLIENT_SECRET")
-        ])
-        
         # Check if analyst routes are actually registered
         analyst_routes = []
         for route in req.app.router.routes():
@@ -174,7 +243,7 @@ async def health(req: Request) -> Response:
                 "console": "available" if LOADED_FEATURES["sql_console"] else "not loaded",
                 "admin_dashboard": "available" if LOADED_FEATURES["admin_dashboard"] else "not loaded",
                 "sql_translator": "available" if LOADED_FEATURES["sql_translator"] else "not available",
-                "sql_function": "configured" if os.environ.get("AZURE_FUNCTION_URL") else "not configured",
+                "sql_function": "configured" if ENV_STATUS.function_configured else "not configured",
                 "powerbi_analyst": "available" if LOADED_FEATURES["powerbi_analyst"] else "not loaded"
             },
             "features": {
@@ -182,14 +251,11 @@ async def health(req: Request) -> Response:
                 "query_fixing": SQL_TRANSLATOR is not None,
                 "multi_database": True,
                 "standardization_checks": True,
-                "powerbi_integration": powerbi_configured,
-                "business_intelligence": powerbi_configured and LOADED_FEATURES["powerbi_analyst"]
+                "powerbi_integration": ENV_STATUS.powerbi_configured,
+                "business_intelligence": ENV_STATUS.powerbi_configured and LOADED_FEATURES["powerbi_analyst"]
             },
             "powerbi_config": {
-                "tenant_id_set": bool(os.environ.get("POWERBI_TENANT_ID")),
-                "client_id_set": bool(os.environ.get("POWERBI_CLIENT_ID")),
-                "client_secret_set": bool(os.environ.get("POWERBI_CLIENT_SECRET")),
-                "all_configured": powerbi_configured,
+                **ENV_STATUS.powerbi_config,
                 "routes_registered": analyst_routes_registered,
                 "route_count": len(analyst_routes),
                 "actual_loaded": LOADED_FEATURES["powerbi_analyst"]
@@ -199,7 +265,7 @@ async def health(req: Request) -> Response:
                 "total": len(list(req.app.router.routes())),
                 "analyst_routes": analyst_routes[:5] if analyst_routes else []  # Show first 5
             },
-            "missing_vars": missing_vars,
+            "missing_vars": ENV_STATUS.missing_vars,
             "import_errors": IMPORT_ERRORS,
             "python_version": sys.version
         }
@@ -208,7 +274,10 @@ async def health(req: Request) -> Response:
         if SQL_TRANSLATOR:
             health_status["token_usage"] = SQL_TRANSLATOR.get_usage_summary()
         
-        return json_response(health_status)
+        body = _json_bytes(health_status)
+        _HEALTH_CACHE["ts"] = now
+        _HEALTH_CACHE["body"] = body
+        return Response(body=body, content_type='application/json', charset='utf-8')
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -218,26 +287,22 @@ async def health(req: Request) -> Response:
             "timestamp": datetime.now().isoformat()
         }, status=503)
 
-# Root endpoint
-async def index(req: Request) -> Response:
-    """Root endpoint with navigation"""
+# Root page only changes when a feature finishes loading, so it is rendered
+# once and dropped by init_sql_translator
+_INDEX_CACHE = {"body": None}
+
+def _render_index_page() -> bytes:
+    """Render the navigation page from the current feature status"""
     
     # Check if analyst routes are registered
     analyst_routes_registered = LOADED_FEATURES["powerbi_analyst"]
     
-    # Check Power BI configuration
-    powerbi_configured = all([
-        os.environ.get("POWERBI_TENANT_ID"),
-        os.environ.get("POWERBI_CLIENT_ID"),
-        os.environ.get("POWERBI_CLIENT_SECRET")
-    ])
-    
     analyst_section = ""
     if analyst_routes_registered:
         analyst_section = '''
                 <a href="/analyst">Power BI Analyst</a>
                 <span class="new-badge">NEW</span>'''
-    elif powerbi_configured:
+    elif ENV_STATUS.powerbi_configured:
         analyst_section = '''
                 <a href="/analyst" style="opacity: 0.7;">Power BI Analyst</a>
                 <span style="font-size: 12px; color: #666;">(Failed to load)</span>'''
@@ -390,14 +455,14 @@ async def index(req: Request) -> Response:
             <div class="status">
                 Environment: {DEPLOYMENT_ENV}<br>
                 SQL Translator: {'✅ Ready' if LOADED_FEATURES["sql_translator"] else '❌ Not Available'}<br>
-                Power BI Analyst: {'✅ Loaded' if LOADED_FEATURES["powerbi_analyst"] else '⚠️ Not Loaded' if powerbi_configured else '❌ Not Configured'}<br>
+                Power BI Analyst: {'✅ Loaded' if LOADED_FEATURES["powerbi_analyst"] else '⚠️ Not Loaded' if ENV_STATUS.powerbi_configured else '❌ Not Configured'}<br>
                 Features Loaded: {sum(1 for v in LOADED_FEATURES.values() if v)}/{len(LOADED_FEATURES)}
             </div>
             
             <div class="debug-info">
                 <strong>Debug Info:</strong><br>
                 Power BI Routes Loaded: {LOADED_FEATURES["powerbi_analyst"]}<br>
-                Power BI Configured: {powerbi_configured}<br>
+                Power BI Configured: {ENV_STATUS.powerbi_configured}<br>
                 Import Errors: {len(IMPORT_ERRORS)}<br>
                 Check /health for detailed diagnostics
             </div>
@@ -406,31 +471,34 @@ async def index(req: Request) -> Response:
     </html>
     """
     
-    return Response(text=html, content_type='text/html')
+    return html.encode('utf-8')
+
+# Root endpoint
+@catch_errors
+async def index(req: Request) -> Response:
+    """Root endpoint with navigation"""
+    body = _INDEX_CACHE["body"]
+    if body is None:
+        body = _INDEX_CACHE["body"] = _render_index_page()
+    return Response(body=body, content_type='text/html', charset='utf-8')
 
 # Create the application
-APP = web.Application(middlewares=[aiohttp_error_middleware])
+APP = web.Application()
 
 # Add main routes
 APP.router.add_get("/", index)
 APP.router.add_get("/health", health)
 
 # Simple info endpoint (add early to ensure it works)
+@catch_errors
 async def info(req: Request) -> Response:
     """Information about the application"""
     
-    # Check Power BI configuration
-    powerbi_configured = all([
-        os.environ.get("POWERBI_TENANT_ID"),
-        os.environ.get("POWERBI_CLIENT_ID"),
-        os.environ.get("POWERBI_CLIENT_SECRET")
-    ])
-    
     info_data = {
         'name': 'SQL Assistant Enhanced with Power BI',
         'version': '2.2.3',
         'features_loaded': LOADED_FEATURES,
-        'powerbi_configured': powerbi_configured,
+        'powerbi_configured': ENV_STATUS.powerbi_configured,
         'routes_count': len(list(APP.router.routes())),
         'timestamp': datetime.now().isoformat(),
         'import_errors': IMPORT_ERRORS
@@ -448,7 +516,7 @@ APP.router.add_get("/info", info)
 try:
     logger.info("Loading admin dashboard...")
     from admin_dashboard_routes import add_admin_routes
-    add_admin_routes(APP, SQL_TRANSLATOR)
+    ADMIN_DASHBOARD = add_admin_routes(APP, SQL_TRANSLATOR, HTTP_SESSION)
     logger.info("✓ Admin dashboard routes added")
     LOADED_FEATURES["admin_dashboard"] = True
 except ImportError as e:
@@ -462,7 +530,7 @@ except Exception as e:
 try:
     logger.info("Loading SQL console...")
     from sql_console_routes import add_console_routes
-    add_console_routes(APP, SQL_TRANSLATOR)
+    SQL_CONSOLE = add_console_routes(APP, SQL_TRANSLATOR)
     logger.info("✓ Enhanced SQL console routes added with error analysis")
     LOADED_FEATURES["sql_console"] = True
 except ImportError as e:
@@ -477,19 +545,11 @@ logger.info("=" * 60)
 logger.info("ATTEMPTING TO LOAD POWER BI ANALYST...")
 logger.info("=" * 60)
 
-# Check configuration before attempting to load
-powerbi_configured = all([
-    os.environ.get("POWERBI_TENANT_ID"),
-    os.environ.get("POWERBI_CLIENT_ID"),
-    os.environ.get("POWERBI_CLIENT_SECRET")
-])
-
-if not powerbi_configured:
+if not ENV_STATUS.powerbi_configured:
     logger.warning("Power BI environment variables not configured")
     
-    # Add placeholder route
-    async def analyst_not_configured(request):
-        return Response(text="""
+    # Placeholder page is static, so encode it once
+    ANALYST_NOT_CONFIGURED_PAGE = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -513,7 +573,11 @@ if not powerbi_configured:
             </div>
         </body>
         </html>
-        """, content_type='text/html')
+        """.encode('utf-8')
+    
+    # Add placeholder route
+    async def analyst_not_configured(request):
+        return Response(body=ANALYST_NOT_CONFIGURED_PAGE, content_type='text/html', charset='utf-8')
     
     APP.router.add_get('/analyst', analyst_not_configured)
     logger.info("Added placeholder route for unconfigured Power BI Analyst")
@@ -599,57 +663,59 @@ else:
         logger.error(f"Failed to load Power BI Analyst: {e}", exc_info=True)
         IMPORT_ERRORS['powerbi_analyst'] = str(e) + "\n" + traceback.format_exc()
         
-        # Add detailed error page
-        async def analyst_error(request):
-            import_errors_html = ""
-            for module, error in IMPORT_ERRORS.items():
-                if 'powerbi' in module or 'analyst' in module:
-                    import_errors_html += f"""
-                    <div class="error-detail">
-                        <h4>{module}</h4>
-                        <pre>{error}</pre>
-                    </div>
-                    """
-            
-            return Response(text=f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Power BI Analyst - Loading Error</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; padding: 40px; background: #f5f5f5; }}
-                    .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; }}
-                    h1 {{ color: #333; }}
-                    .error {{ background: #fee; padding: 20px; border-radius: 5px; margin: 20px 0; }}
-                    .error-detail {{ background: #f0f0f0; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-                    .error-detail h4 {{ margin-top: 0; color: #c00; }}
-                    pre {{ overflow: auto; white-space: pre-wrap; font-size: 12px; }}
-                    .suggestions {{ background: #e6f3ff; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h1>Power BI Analyst - Module Loading Error</h1>
-                    <div class="error">
-                        <h2>The Power BI Analyst module failed to load</h2>
-                        <h3>Import Errors:</h3>
-                        {import_errors_html}
-                    </div>
-                    <div class="suggestions">
-                        <h3>Troubleshooting Steps:</h3>
-                        <ol>
-                            <li>Check the application logs in Azure Portal</li>
-                            <li>Verify all required packages are in requirements.txt</li>
-                            <li>Ensure MSAL is installed: <code>pip install msal</code></li>
-                            <li>Check for syntax errors in the Python files</li>
-                            <li>Restart the App Service after fixing issues</li>
-                        </ol>
-                    </div>
-                    <p><a href="/health">Check Health Status</a> | <a href="/">Back to Home</a></p>
+        # The import errors are final by now, so render the error page once
+        import_errors_html = ""
+        for module, error in IMPORT_ERRORS.items():
+            if 'powerbi' in module or 'analyst' in module:
+                import_errors_html += f"""
+                <div class="error-detail">
+                    <h4>{module}</h4>
+                    <pre>{error}</pre>
                 </div>
-            </body>
-            </html>
-            """, content_type='text/html')
+                """
+        
+        ANALYST_ERROR_PAGE = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Power BI Analyst - Loading Error</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; padding: 40px; background: #f5f5f5; }}
+                .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; }}
+                h1 {{ color: #333; }}
+                .error {{ background: #fee; padding: 20px; border-radius: 5px; margin: 20px 0; }}
+                .error-detail {{ background: #f0f0f0; padding: 15px; margin: 10px 0; border-radius: 5px; }}
+                .error-detail h4 {{ margin-top: 0; color: #c00; }}
+                pre {{ overflow: auto; white-space: pre-wrap; font-size: 12px; }}
+                .suggestions {{ background: #e6f3ff; padding: 15px; border-radius: 5px; margin: 20px 0; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>Power BI Analyst - Module Loading Error</h1>
+                <div class="error">
+                    <h2>The Power BI Analyst module failed to load</h2>
+                    <h3>Import Errors:</h3>
+                    {import_errors_html}
+                </div>
+                <div class="suggestions">
+                    <h3>Troubleshooting Steps:</h3>
+                    <ol>
+                        <li>Check the application logs in Azure Portal</li>
+                        <li>Verify all required packages are in requirements.txt</li>
+                        <li>Ensure MSAL is installed: <code>pip install msal</code></li>
+                        <li>Check for syntax errors in the Python files</li>
+                        <li>Restart the App Service after fixing issues</li>
+                    </ol>
+                </div>
+                <p><a href="/health">Check Health Status</a> | <a href="/">Back to Home</a></p>
+            </div>
+        </body>
+        </html>
+        """.encode('utf-8')
+        
+        async def analyst_error(request):
+            return Response(body=ANALYST_ERROR_PAGE, content_type='text/html', charset='utf-8')
         
         APP.router.add_get('/analyst', analyst_error)
         APP.router.add_get('/analyst/', analyst_error)
@@ -671,6 +737,30 @@ for i, route in enumerate(APP.router.routes()):
         route_info = str(route.resource)
     logger.info(f"  {i+1}. {route_info}")
 
+def _create_sql_translator():
+    """Import and construct the SQL translator (blocking)"""
+    from sql_translator import SQLTranslator
+    return SQLTranslator()
+
+async def init_sql_translator():
+    """Build the SQL translator off the event loop and hand it to the loaded components"""
+    global SQL_TRANSLATOR
+    try:
+        SQL_TRANSLATOR = await asyncio.to_thread(_create_sql_translator)
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize SQL Translator: {e}")
+        IMPORT_ERRORS["sql_translator"] = str(e)
+    else:
+        for component in (ADMIN_DASHBOARD, SQL_CONSOLE):
+            if component is not None:
+                component.sql_translator = SQL_TRANSLATOR
+        LOADED_FEATURES["sql_translator"] = True
+        logger.info("✓ Unified SQL Translator initialized with error analysis")
+    finally:
+        # Either outcome changes what / and /health report
+        _HEALTH_CACHE["body"] = None
+        _INDEX_CACHE["body"] = None
+
 # Startup tasks
 async def on_startup(app):
     """Perform startup tasks"""
@@ -680,19 +770,13 @@ async def on_startup(app):
     logger.info(f"Features Loaded: {LOADED_FEATURES}")
     logger.info(f"Import Errors: {len(IMPORT_ERRORS)}")
     
-    if missing_vars:
-        logger.warning(f"⚠️ Missing environment variables: {', '.join(missing_vars)}")
+    if ENV_STATUS.missing_vars:
+        logger.warning(f"⚠️ Missing environment variables: {', '.join(ENV_STATUS.missing_vars)}")
     else:
         logger.info("✓ All required environment variables are set")
     
     # Log Power BI status
-    powerbi_configured = all([
-        os.environ.get("POWERBI_TENANT_ID"),
-        os.environ.get("POWERBI_CLIENT_ID"),
-        os.environ.get("POWERBI_CLIENT_SECRET")
-    ])
-    
-    logger.info(f"Power BI Configuration: {powerbi_configured}")
+    logger.info(f"Power BI Configuration: {ENV_STATUS.powerbi_configured}")
     logger.info(f"Power BI Analyst Loaded: {LOADED_FEATURES.get('powerbi_analyst', False)}")
     
     # Final route check
@@ -705,9 +789,21 @@ async def on_startup(app):
         for module, error in IMPORT_ERRORS.items():
             logger.error(f"{module}: {error.splitlines()[0]}")  # First line only
     
-    # Create necessary directories
+    # Start serving immediately; the translator becomes available when ready
+    if TRANSLATOR_CONFIGURED:
+        app[TRANSLATOR_INIT] = asyncio.create_task(init_sql_translator())
+    
+    # One pooled session for outbound probes so connections are reused
+    app[HTTP_SESSION] = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=5),
+        connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+    )
+    
+    # Create necessary directories (startup.sh normally creates them already)
     dirs = ['.token_usage', 'logs', '.query_history', '.error_logs', '.analyst_cache']
     for dir_name in dirs:
+        if os.path.isdir(dir_name):
+            continue
         try:
             os.makedirs(dir_name, exist_ok=True)
         except Exception as e:
@@ -720,6 +816,14 @@ async def on_cleanup(app):
     """Perform cleanup tasks"""
     logger.info("SQL Assistant shutting down...")
     
+    init_task = app.get(TRANSLATOR_INIT)
+    if init_task is not None and not init_task.done():
+        init_task.cancel()
+    
+    session = app.get(HTTP_SESSION)
+    if session is not None:
+        await session.close()
+    
     # Save token usage if available
     if SQL_TRANSLATOR:
         usage = SQL_TRANSLATOR.get_usage_summary()
@@ -775,6 +879,14 @@ if __name__ == "__main__":
             if hasattr(route, 'resource'):
                 logger.info(f"  - {route.resource}")
         
+        # libuv-backed event loop when available (not supported on Windows)
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("✓ Using uvloop event loop")
+        except ImportError:
+            logger.info("uvloop not installed, using default asyncio event loop")
+        
         web.run_app(
             APP,
             host="0.0.0.0",
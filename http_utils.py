@@ -0,0 +1,99 @@
+# http_utils.py - Shared HTTP helpers for the route modules
+"""
+HTTP Utilities - Precompressed static responses and function URL checks
+"""
+
+import gzip
+import re
+from aiohttp.web import Request, Response
+
+# Handle optional compression codecs
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Function key passed as a ?code=/&code= query parameter (not just "code=" anywhere in the URL)
+FUNCTION_KEY_RE = re.compile(r"[?&]code=", re.IGNORECASE)
+
+# Preferred content codings for precompressed static bodies, best first
+ENCODING_PREFERENCE = ("br", "zstd", "gzip")
+
+def compress_variants(body: bytes) -> dict:
+    """Precompress a static body with every available codec"""
+    variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9)}
+    if BROTLI_AVAILABLE:
+        variants["br"] = brotli.compress(body, quality=11)
+    if ZSTD_AVAILABLE:
+        variants["zstd"] = zstandard.ZstdCompressor(level=19).compress(body)
+    return variants
+
+def negotiate_encoding(accept_encoding: str, variants: dict) -> str:
+    """Pick the best encoding the client accepts from the available variants"""
+    accepted = set()
+    for token in accept_encoding.lower().split(","):
+        coding, _, params = token.partition(";")
+        name, _, value = params.partition("=")
+        if name.strip() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+
+    for coding in ENCODING_PREFERENCE:
+        if coding in variants and (coding in accepted or "*" in accepted):
+            return coding
+    return "identity"
+
+def variant_etags(variants: dict, tag: str) -> dict:
+    """Give each encoded variant its own strong ETag; each coding is a distinct representation"""
+    return {
+        encoding: f'"{tag}"' if encoding == "identity" else f'"{tag}-{encoding}"'
+        for encoding in variants
+    }
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (a list, possibly weak or "*") against an ETag"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match uses weak comparison, so a W/ prefix is ignored
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def variant_response(request: Request, variants: dict, content_type: str,
+                     etags: dict = None, cache_control: str = None) -> Response:
+    """Build a response, or a 304, from the best precompressed variant for the client"""
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding", ""), variants)
+    headers = {"Vary": "Accept-Encoding"}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etags:
+        headers["ETag"] = etags[encoding]
+        if etag_matches(request.headers.get("If-None-Match", ""), etags[encoding]):
+            return Response(status=304, headers=headers)
+
+    response = Response(
+        body=variants[encoding],
+        content_type=content_type,
+        charset='utf-8',
+        headers=headers
+    )
+    if encoding != "identity":
+        response.headers["Content-Encoding"] = encoding
+    return response
@@ -10,12 +10,23 @@ Run: python kudu_test.py
 import os
 import sys
 
-print("=== POWER BI CONFIGURATION TEST ===")
-print(f"Python Version: {sys.version}")
-print(f"Current Directory: {os.getcwd()}")
+# Kudu's console is slow to render many small writes, so each section is
+# collected here and written in one go
+_lines = []
+out = _lines.append
+
+def flush():
+    """Write the buffered lines to stdout in a single call"""
+    sys.stdout.write("\n".join(_lines) + "\n")
+    sys.stdout.flush()
+    _lines.clear()
+
+out("=== POWER BI CONFIGURATION TEST ===")
+out(f"Python Version: {sys.version}")
+out(f"Current Directory: {os.getcwd()}")
 
 # Check environment variables
-print("\n1. Checking Environment Variables:")
+out("\n1. Checking Environment Variables:")
 env_vars = {
     "POWERBI_TENANT_ID": os.environ.get("POWERBI_TENANT_ID", "NOT SET"),
     "POWERBI_CLIENT_ID": os.environ.get("POWERBI_CLIENT_ID", "NOT SET"),
@@ -25,16 +36,16 @@ env_vars = {
 all_set = True
 for var, value in env_vars.items():
     if value == "NOT SET":
-        print(f"  ✗ {var}: NOT SET")
+        out(f"  ✗ {var}: NOT SET")
         all_set = False
     else:
         if "SECRET" in var:
-            print(f"  ✓ {var}: ****** (hidden)")
+            out(f"  ✓ {var}: ****** (hidden)")
         else:
-            print(f"  ✓ {var}: {value[:20]}...")
+            out(f"  ✓ {var}: {value[:20]}...")
 
 # Check if files exist
-print("\n2. Checking Required Files:")
+out("\n2. Checking Required Files:")
 files_to_check = [
     "powerbi_client.py",
     "analyst_routes.py",
@@ -45,65 +56,69 @@ files_to_check = [
 
 for file in files_to_check:
     if os.path.exists(file):
-        print(f"  ✓ {file} exists")
+        out(f"  ✓ {file} exists")
     else:
-        print(f"  ✗ {file} NOT FOUND")
+        out(f"  ✗ {file} NOT FOUND")
+
+flush()
 
 # Try to import modules
-print("\n3. Testing Imports:")
+out("\n3. Testing Imports:")
 try:
     import msal
-    print("  ✓ msal imported successfully")
+    out("  ✓ msal imported successfully")
 except ImportError:
-    print("  ✗ msal import failed - run: pip install msal")
+    out("  ✗ msal import failed - run: pip install msal")
 
 try:
     from powerbi_client import powerbi_client
-    print("  ✓ powerbi_client imported successfully")
-    print(f"     Client configured: {powerbi_client.is_configured()}")
+    out("  ✓ powerbi_client imported successfully")
+    out(f"     Client configured: {powerbi_client.is_configured()}")
 except Exception as e:
-    print(f"  ✗ powerbi_client import failed: {e}")
+    out(f"  ✗ powerbi_client import failed: {e}")
 
 try:
     from analyst_routes import add_analyst_routes
-    print("  ✓ analyst_routes imported successfully")
+    out("  ✓ analyst_routes imported successfully")
 except Exception as e:
-    print(f"  ✗ analyst_routes import failed: {e}")
+    out(f"  ✗ analyst_routes import failed: {e}")
 
 # Quick configuration check
-print("\n4. Configuration Summary:")
+out("\n4. Configuration Summary:")
 if all_set:
-    print("  ✓ All Power BI environment variables are set")
-    print("  → The /analyst endpoint should be available")
-    print("  → If still getting 404, restart the app service")
+    out("  ✓ All Power BI environment variables are set")
+    out("  → The /analyst endpoint should be available")
+    out("  → If still getting 404, restart the app service")
 else:
-    print("  ✗ Missing Power BI configuration")
-    print("  → Set the missing environment variables in Azure Portal")
-    print("  → App Service > Configuration > Application settings")
+    out("  ✗ Missing Power BI configuration")
+    out("  → Set the missing environment variables in Azure Portal")
+    out("  → App Service > Configuration > Application settings")
 
-print("\n5. Next Steps:")
+out("\n5. Next Steps:")
 if all_set:
-    print("  1. Restart the app service if you haven't already")
-    print("  2. Visit https://sqlbottest.azurewebsites.net/health")
-    print("  3. Check if powerbi_analyst shows as 'available'")
-    print("  4. Try https://sqlbottest.azurewebsites.net/analyst")
+    out("  1. Restart the app service if you haven't already")
+    out("  2. Visit https://sqlbottest.azurewebsites.net/health")
+    out("  3. Check if powerbi_analyst shows as 'available'")
+    out("  4. Try https://sqlbottest.azurewebsites.net/analyst")
 else:
-    print("  1. Set the missing environment variables")
-    print("  2. Save configuration and restart app service")
-    print("  3. Run this test again to verify")
+    out("  1. Set the missing environment variables")
+    out("  2. Save configuration and restart app service")
+    out("  3. Run this test again to verify")
 
-print("\n=== TEST COMPLETE ===")
+out("\n=== TEST COMPLETE ===")
+flush()
 
 # If running interactively, try a simple test
 if all_set:
-    print("\nBonus: Checking Power BI client initialization...")
+    out("\nBonus: Checking Power BI client initialization...")
     try:
         from powerbi_client import PowerBIClient
         client = PowerBIClient()
-        print(f"  Client initialized: {client.configured}")
+        out(f"  Client initialized: {client.configured}")
         if client.configured:
-            print("  ✓ Power BI client is ready")
+            out("  ✓ Power BI client is ready")
         else:
-            print("  ✗ Client initialization failed")
+            out("  ✗ Client initialization failed")
     except Exception as e:
-        print(f"  ✗ Error: {e}")
\ No newline at end of file
+        out(f"  ✗ Error: {e}")
+    flush()
\ No newline at end of file
@@ -8,6 +8,8 @@ import os
 import json
 import logging
 import asyncio
+import time
+from contextlib import asynccontextmanager
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -28,8 +30,41 @@ try:
 except ImportError:
     JWT_AVAILABLE = False
 
+# Handle orjson import with fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Keep a handful of requests in flight at once so parallel probes don't get throttled
+MAX_CONCURRENT_REQUESTS = 4
+# Throttling/unavailable responses are retried briefly; auth and not-found errors are not
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 2
+# Error bodies are only logged, so don't pull more than this off the wire
+ERROR_BODY_LIMIT = 4096
+
+# Shared request timeouts: reachability check, diagnostic probes, listings and DAX queries
+HEAD_TIMEOUT = aiohttp.ClientTimeout(total=5)
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+LIST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+QUERY_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+def _json_dumps(data: Any) -> str:
+    """Serialize request payloads, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Parse a response body as JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(await response.read())
+    return await response.json()
+
 @dataclass
 class PowerBICredentials:
     """Power BI authentication credentials"""
@@ -77,6 +112,16 @@ class PowerBIClient:
     """Client for interacting with Power BI REST API"""
     
     def __init__(self):
+        # Pooled HTTP session, created on first use and shared by all API calls
+        self._session = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Request headers for the most recent token, reused until the token changes
+        self._auth_headers = (None, None)
+        # Background startup probe that resolves DNS and opens the first pooled connection
+        self._warm_up_task = None
+        # Admin/apps/features probes only log access diagnostics, so skip them unless asked
+        self.diagnostic_probes = os.environ.get("POWERBI_DIAGNOSTIC_PROBES", "").lower() in ("1", "true", "yes")
+        
         # Check dependencies first
         if not MSAL_AVAILABLE:
             logger.error("MSAL library not available. Install with: pip install msal")
@@ -130,6 +175,80 @@ class PowerBIClient:
         
         logger.info(f"Power BI Client initialized - Configured: {self.configured}")
     
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session so calls reuse pooled connections to the API"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                json_serialize=_json_dumps,
+                connector=aiohttp.TCPConnector(
+                    limit=16,
+                    limit_per_host=MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=300
+                )
+            )
+        return self._session
+    
+    def get_auth_headers(self, access_token: str) -> Dict[str, str]:
+        """Get request headers for a token, building them only when the token changes"""
+        token, headers = self._auth_headers
+        if token != access_token:
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json"
+            }
+            self._auth_headers = (access_token, headers)
+        return headers
+    
+    @asynccontextmanager
+    async def _request(self, session: aiohttp.ClientSession, method: str, url: str, **kwargs):
+        """Send a request under the concurrency cap, retrying briefly on 429/503.
+        
+        Successful bodies are read before the slot is released, so callers
+        can nest requests inside the block without holding a connection.
+        Error bodies are left unread for _read_error_text.
+        """
+        async with self._semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                response = await session.request(method, url, **kwargs)
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                response.release()
+                logger.info(f"Power BI API returned {response.status}, retrying ({attempt + 1}/{MAX_RETRIES})")
+                await asyncio.sleep(2 ** attempt * 0.1)
+            if response.status < 400:
+                try:
+                    await response.read()
+                except BaseException:
+                    response.release()
+                    raise
+        try:
+            yield response
+        finally:
+            response.release()
+    
+    async def warm_up(self, app=None):
+        """Start resolving the API host and opening a connection without delaying startup"""
+        if self.configured and self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self.check_api_reachable())
+    
+    async def close(self, app=None):
+        """Close the shared HTTP session, if one was opened"""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    @staticmethod
+    async def _read_error_text(response: aiohttp.ClientResponse) -> str:
+        """Read at most ERROR_BODY_LIMIT bytes of an error body for logging"""
+        raw = b""
+        while len(raw) < ERROR_BODY_LIMIT:
+            chunk = await response.content.read(ERROR_BODY_LIMIT - len(raw))
+            if not chunk:
+                break
+            raw += chunk
+        return raw.decode("utf-8", errors="replace")
+    
     async def get_access_token(self) -> Optional[str]:
         """Get access token for Power BI API with enhanced debugging"""
         if not self.configured:
@@ -204,198 +323,47 @@ class PowerBIClient:
             logger.error(f"Exception while getting access token: {e}", exc_info=True)
             return None
     
+    async def check_api_reachable(self) -> bool:
+        """Cheap HEAD probe of the API host, so a dead endpoint fails fast instead of per call"""
+        try:
+            session = self.get_session()
+            async with self._request(
+                session, "HEAD",
+                self.base_url,
+                allow_redirects=False,
+                timeout=HEAD_TIMEOUT
+            ) as response:
+                # Any answer short of a server error means the host is up
+                return response.status < 500
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Power BI API unreachable: {e}")
+            return False
+    
     async def get_user_workspaces(self, access_token: str) -> List[WorkspaceInfo]:
         """Get list of workspaces accessible to the user/app with enhanced debugging"""
         try:
             logger.info("Fetching accessible workspaces...")
             
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers(access_token)
             
-            async with aiohttp.ClientSession() as session:
-                # First, let's check what kind of access we have
+            session = self.get_session()
+            # The admin, apps and features probes are diagnostic only and
+            # independent of each other, so run them alongside the groups call
+            probes = None
+            if self.diagnostic_probes:
                 logger.info("Testing API access levels...")
+                probes = asyncio.gather(
+                    self._probe_admin_api(session, headers),
+                    self._probe_apps_api(session, headers),
+                    self._probe_features_api(session, headers),
+                    return_exceptions=True
+                )
+            try:
+                return await self._fetch_groups(session, headers)
+            finally:
+                if probes is not None:
+                    await probes
                 
-                # Test 1: Try admin endpoint (requires Tenant.Read.All)
-                try:
-                    async with session.get(
-                        f"{self.base_url}/admin/workspaces?$top=5",
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as admin_response:
-                        
-                        if admin_response.status == 200:
-                            logger.info("✓ Admin API access confirmed (Tenant.Read.All working)")
-                            admin_data = await admin_response.json()
-                            admin_workspaces = admin_data.get("value", [])
-                            logger.info(f"Admin API shows {len(admin_workspaces)} workspaces in tenant")
-                        else:
-                            logger.info(f"✗ Admin API access denied (status: {admin_response.status})")
-                except Exception as e:
-                    logger.info(f"✗ Admin API test failed: {e}")
-                
-                # Test 2: Regular groups endpoint
-                async with session.get(
-                    f"{self.base_url}/groups",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    
-                    logger.info(f"Groups API response status: {response.status}")
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        workspaces = []
-                        
-                        # Log raw response for debugging
-                        logger.info(f"Groups API returned {len(data.get('value', []))} items")
-                        
-                        # Process workspaces from groups endpoint
-                        for ws in data.get("value", []):
-                            logger.info(f"Found workspace: {ws.get('name', 'Unknown')} (ID: {ws.get('id', 'Unknown')[:8]}..., type: {ws.get('type', 'Unknown')}, state: {ws.get('state', 'Unknown')})")
-                            
-                            workspace = WorkspaceInfo(
-                                id=ws["id"],
-                                name=ws["name"],
-                                description=ws.get("description"),
-                                is_personal=ws.get("isPersonal", False),
-                                capacity_id=ws.get("capacityId"),
-                                type=ws.get("type", "Workspace"),
-                                state=ws.get("state", "Active")
-                            )
-                            
-                            # Only include active workspaces
-                            if workspace.state == "Active":
-                                workspaces.append(workspace)
-                            else:
-                                logger.info(f"Skipping inactive workspace: {workspace.name}")
-                        
-                        # Test 3: Check if we're a service principal
-                        try:
-                            async with session.get(
-                                f"{self.base_url}/apps",
-                                headers=headers,
-                                timeout=aiohttp.ClientTimeout(total=10)
-                            ) as apps_response:
-                                
-                                if apps_response.status == 200:
-                                    apps_data = await apps_response.json()
-                                    logger.info(f"Apps API shows {len(apps_data.get('value', []))} apps")
-                                else:
-                                    logger.info(f"Apps API status: {apps_response.status}")
-                        except Exception as e:
-                            logger.info(f"Apps API test: {e}")
-                        
-                        # Test 4: Try to get available features
-                        try:
-                            async with session.get(
-                                f"{self.base_url}/availableFeatures",
-                                headers=headers,
-                                timeout=aiohttp.ClientTimeout(total=10)
-                            ) as features_response:
-                                
-                                if features_response.status == 200:
-                                    features_data = await features_response.json()
-                                    features = features_data.get("features", [])
-                                    logger.info(f"Available features: {', '.join(features[:5])}...")
-                                else:
-                                    logger.info(f"Features API status: {features_response.status}")
-                        except Exception as e:
-                            logger.info(f"Features API test: {e}")
-                        
-                        # If no workspaces found through groups API
-                        if len(workspaces) == 0:
-                            logger.warning("No workspaces found through groups API")
-                            
-                            # Test 5: Try datasets endpoint to see if we have any access
-                            try:
-                                async with session.get(
-                                    f"{self.base_url}/datasets",
-                                    headers=headers,
-                                    timeout=aiohttp.ClientTimeout(total=10)
-                                ) as dataset_response:
-                                    
-                                    if dataset_response.status == 200:
-                                        dataset_data = await dataset_response.json()
-                                        datasets = dataset_data.get("value", [])
-                                        logger.info(f"Found {len(datasets)} datasets in personal workspace")
-                                        
-                                        if datasets:
-                                            # Add a virtual "My Workspace" entry
-                                            workspaces.append(WorkspaceInfo(
-                                                id="me",  # Special ID for personal workspace
-                                                name="My Workspace",
-                                                description="Personal workspace",
-                                                is_personal=True,
-                                                state="Active"
-                                            ))
-                                    else:
-                                        logger.info(f"Datasets API status: {dataset_response.status}")
-                            except Exception as e:
-                                logger.warning(f"Could not check personal workspace: {e}")
-                        
-                        logger.info(f"Retrieved {len(workspaces)} accessible workspaces")
-                        
-                        # Provide helpful messages if no workspaces found
-                        if len(workspaces) == 0:
-                            logger.warning("=" * 60)
-                            logger.warning("NO WORKSPACES FOUND - TROUBLESHOOTING GUIDE:")
-                            logger.warning("=" * 60)
-                            logger.warning("1. Check API Permissions in Azure Portal:")
-                            logger.warning("   - You currently have DELEGATED permissions")
-                            logger.warning("   - For app-only auth, you need APPLICATION permissions")
-                            logger.warning("   - Add: Workspace.Read.All (Application)")
-                            logger.warning("   - Add: Dataset.Read.All (Application)")
-                            logger.warning("")
-                            logger.warning("2. Alternative: Enable Service Principals in Power BI:")
-                            logger.warning("   - Go to Power BI Admin Portal")
-                            logger.warning("   - Tenant settings → Developer settings")
-                            logger.warning("   - Enable 'Service principals can use Power BI APIs'")
-                            logger.warning("   - Add your app's Object ID to the security group")
-                            logger.warning("")
-                            logger.warning("3. Grant Workspace Access:")
-                            logger.warning("   - Go to each Power BI workspace")
-                            logger.warning("   - Click 'Access' → 'Add people or groups'")
-                            logger.warning("   - Search for your app by name or Application ID")
-                            logger.warning("   - Grant 'Viewer' or higher role")
-                            logger.warning("")
-                            logger.warning("4. Wait 5-15 minutes for permissions to propagate")
-                            logger.warning("=" * 60)
-                        
-                        return workspaces
-                    
-                    elif response.status == 401:
-                        error_text = await response.text()
-                        logger.error(f"Unauthorized access to workspaces API: {error_text}")
-                        logger.error("The access token is valid but lacks proper permissions")
-                        return []
-                    
-                    elif response.status == 403:
-                        error_text = await response.text()
-                        logger.error(f"Forbidden access to workspaces API: {error_text}")
-                        
-                        # Parse error for more details
-                        try:
-                            error_json = json.loads(error_text)
-                            error_code = error_json.get("error", {}).get("code", "Unknown")
-                            error_message = error_json.get("error", {}).get("message", "Unknown")
-                            logger.error(f"Error code: {error_code}")
-                            logger.error(f"Error message: {error_message}")
-                            
-                            if "Unauthorized" in error_message:
-                                logger.error("The app registration lacks required API permissions")
-                        except:
-                            pass
-                            
-                        return []
-                    
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get workspaces: {response.status} - {error_text}")
-                        return []
-                        
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching workspaces: {e}")
             return []
@@ -403,15 +371,201 @@ class PowerBIClient:
             logger.error(f"Unexpected error fetching workspaces: {e}", exc_info=True)
             return []
     
+    async def _probe_admin_api(self, session: aiohttp.ClientSession, headers: Dict[str, str]):
+        """Log whether the admin endpoint (Tenant.Read.All) is reachable"""
+        try:
+            async with self._request(
+                session, "GET",
+                f"{self.base_url}/admin/workspaces?$top=5",
+                headers=headers,
+                timeout=PROBE_TIMEOUT
+            ) as admin_response:
+                
+                if admin_response.status == 200:
+                    logger.info("✓ Admin API access confirmed (Tenant.Read.All working)")
+                    admin_data = await _read_json(admin_response)
+                    admin_workspaces = admin_data.get("value", [])
+                    logger.info(f"Admin API shows {len(admin_workspaces)} workspaces in tenant")
+                else:
+                    logger.info(f"✗ Admin API access denied (status: {admin_response.status})")
+        except Exception as e:
+            logger.info(f"✗ Admin API test failed: {e}")
+    
+    async def _probe_apps_api(self, session: aiohttp.ClientSession, headers: Dict[str, str]):
+        """Log what the apps endpoint reports (helps spot service principal access)"""
+        try:
+            async with self._request(
+                session, "GET",
+                f"{self.base_url}/apps",
+                headers=headers,
+                timeout=PROBE_TIMEOUT
+            ) as apps_response:
+                
+                if apps_response.status == 200:
+                    apps_data = await _read_json(apps_response)
+                    logger.info(f"Apps API shows {len(apps_data.get('value', []))} apps")
+                else:
+                    logger.info(f"Apps API status: {apps_response.status}")
+        except Exception as e:
+            logger.info(f"Apps API test: {e}")
+    
+    async def _probe_features_api(self, session: aiohttp.ClientSession, headers: Dict[str, str]):
+        """Log the first few features available to the caller"""
+        try:
+            async with self._request(
+                session, "GET",
+                f"{self.base_url}/availableFeatures",
+                headers=headers,
+                timeout=PROBE_TIMEOUT
+            ) as features_response:
+                
+                if features_response.status == 200:
+                    features_data = await _read_json(features_response)
+                    features = features_data.get("features", [])
+                    logger.info(f"Available features: {', '.join(features[:5])}...")
+                else:
+                    logger.info(f"Features API status: {features_response.status}")
+        except Exception as e:
+            logger.info(f"Features API test: {e}")
+    
+    async def _fetch_groups(self, session: aiohttp.ClientSession, headers: Dict[str, str]) -> List[WorkspaceInfo]:
+        """Read workspaces from the groups endpoint, falling back to the personal workspace"""
+        async with self._request(
+            session, "GET",
+            f"{self.base_url}/groups",
+            headers=headers,
+            timeout=LIST_TIMEOUT
+        ) as response:
+            
+            logger.info(f"Groups API response status: {response.status}")
+            
+            if response.status == 200:
+                data = await _read_json(response)
+                workspaces = []
+                
+                # Log raw response for debugging
+                logger.info(f"Groups API returned {len(data.get('value', []))} items")
+                
+                # Process workspaces from groups endpoint
+                for ws in data.get("value", []):
+                    logger.debug("Found workspace: %s (ID: %.8s..., type: %s, state: %s)",
+                                 ws.get('name', 'Unknown'), ws.get('id', 'Unknown'),
+                                 ws.get('type', 'Unknown'), ws.get('state', 'Unknown'))
+                    
+                    workspace = WorkspaceInfo(
+                        id=ws["id"],
+                        name=ws["name"],
+                        description=ws.get("description"),
+                        is_personal=ws.get("isPersonal", False),
+                        capacity_id=ws.get("capacityId"),
+                        type=ws.get("type", "Workspace"),
+                        state=ws.get("state", "Active")
+                    )
+                    
+                    # Only include active workspaces
+                    if workspace.state == "Active":
+                        workspaces.append(workspace)
+                    else:
+                        logger.info(f"Skipping inactive workspace: {workspace.name}")
+                
+                # If no workspaces found through groups API
+                if len(workspaces) == 0:
+                    logger.warning("No workspaces found through groups API")
+                    
+                    # Test 5: Try datasets endpoint to see if we have any access
+                    try:
+                        async with self._request(
+                            session, "GET",
+                            f"{self.base_url}/datasets",
+                            headers=headers,
+                            timeout=PROBE_TIMEOUT
+                        ) as dataset_response:
+                            
+                            if dataset_response.status == 200:
+                                dataset_data = await _read_json(dataset_response)
+                                datasets = dataset_data.get("value", [])
+                                logger.info(f"Found {len(datasets)} datasets in personal workspace")
+                                
+                                if datasets:
+                                    # Add a virtual "My Workspace" entry
+                                    workspaces.append(WorkspaceInfo(
+                                        id="me",  # Special ID for personal workspace
+                                        name="My Workspace",
+                                        description="Personal workspace",
+                                        is_personal=True,
+                                        state="Active"
+                                    ))
+                            else:
+                                logger.info(f"Datasets API status: {dataset_response.status}")
+                    except Exception as e:
+                        logger.warning(f"Could not check personal workspace: {e}")
+                
+                logger.info(f"Retrieved {len(workspaces)} accessible workspaces")
+                
+                # Provide helpful messages if no workspaces found
+                if len(workspaces) == 0:
+                    logger.warning("=" * 60)
+                    logger.warning("NO WORKSPACES FOUND - TROUBLESHOOTING GUIDE:")
+                    logger.warning("=" * 60)
+                    logger.warning("1. Check API Permissions in Azure Portal:")
+                    logger.warning("   - You currently have DELEGATED permissions")
+                    logger.warning("   - For app-only auth, you need APPLICATION permissions")
+                    logger.warning("   - Add: Workspace.Read.All (Application)")
+                    logger.warning("   - Add: Dataset.Read.All (Application)")
+                    logger.warning("")
+                    logger.warning("2. Alternative: Enable Service Principals in Power BI:")
+                    logger.warning("   - Go to Power BI Admin Portal")
+                    logger.warning("   - Tenant settings → Developer settings")
+                    logger.warning("   - Enable 'Service principals can use Power BI APIs'")
+                    logger.warning("   - Add your app's Object ID to the security group")
+                    logger.warning("")
+                    logger.warning("3. Grant Workspace Access:")
+                    logger.warning("   - Go to each Power BI workspace")
+                    logger.warning("   - Click 'Access' → 'Add people or groups'")
+                    logger.warning("   - Search for your app by name or Application ID")
+                    logger.warning("   - Grant 'Viewer' or higher role")
+                    logger.warning("")
+                    logger.warning("4. Wait 5-15 minutes for permissions to propagate")
+                    logger.warning("=" * 60)
+                
+                return workspaces
+            
+            elif response.status == 401:
+                error_text = await self._read_error_text(response)
+                logger.error(f"Unauthorized access to workspaces API: {error_text}")
+                logger.error("The access token is valid but lacks proper permissions")
+                return []
+            
+            elif response.status == 403:
+                error_text = await self._read_error_text(response)
+                logger.error(f"Forbidden access to workspaces API: {error_text}")
+                
+                # Parse error for more details
+                try:
+                    error_json = json.loads(error_text)
+                    error_code = error_json.get("error", {}).get("code", "Unknown")
+                    error_message = error_json.get("error", {}).get("message", "Unknown")
+                    logger.error(f"Error code: {error_code}")
+                    logger.error(f"Error message: {error_message}")
+                    
+                    if "Unauthorized" in error_message:
+                        logger.error("The app registration lacks required API permissions")
+                except:
+                    pass
+                    
+                return []
+            
+            else:
+                error_text = await self._read_error_text(response)
+                logger.error(f"Failed to get workspaces: {response.status} - {error_text}")
+                return []
+
     async def get_workspace_datasets(self, access_token: str, workspace_id: str, workspace_name: str = "") -> List[DatasetInfo]:
         """Get datasets in a specific workspace"""
         try:
             logger.info(f"Fetching datasets for workspace: {workspace_name} (ID: {workspace_id[:8] if workspace_id != 'me' else 'personal'}...)")
             
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers(access_token)
             
             # Handle personal workspace differently
             if workspace_id == "me":
@@ -419,61 +573,62 @@ class PowerBIClient:
             else:
                 url = f"{self.base_url}/groups/{workspace_id}/datasets"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    
-                    logger.info(f"Dataset API response status: {response.status}")
+            session = self.get_session()
+            async with self._request(
+                session, "GET",
+                url,
+                headers=headers,
+                timeout=LIST_TIMEOUT
+            ) as response:
+                
+                logger.info(f"Dataset API response status: {response.status}")
+                
+                if response.status == 200:
+                    data = await _read_json(response)
+                    datasets = []
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        datasets = []
+                    for ds in data.get("value", []):
+                        # Log dataset info
+                        logger.debug("Found dataset: %s (ID: %.8s...)", ds.get('name', 'Unknown'), ds.get('id', 'Unknown'))
                         
-                        for ds in data.get("value", []):
-                            # Log dataset info
-                            logger.info(f"Found dataset: {ds.get('name', 'Unknown')} (ID: {ds.get('id', 'Unknown')[:8]}...)")
-                            
-                            # Only include datasets that can be queried
-                            if ds.get("isRefreshable", True) or ds.get("isEffectiveIdentityRequired", False) or True:  # Be more permissive
-                                dataset = DatasetInfo(
-                                    id=ds["id"],
-                                    name=ds["name"],
-                                    workspace_id=workspace_id,
-                                    workspace_name=workspace_name or "My Workspace" if workspace_id == "me" else workspace_name,
-                                    configured_by=ds.get("configuredBy"),
-                                    created_date=ds.get("createdDate"),
-                                    content_provider_type=ds.get("contentProviderType")
-                                )
-                                datasets.append(dataset)
-                            else:
-                                logger.info(f"Skipping non-queryable dataset: {ds.get('name', 'Unknown')}")
-                        
-                        logger.info(f"Retrieved {len(datasets)} queryable datasets from workspace {workspace_name}")
-                        return datasets
-                    
-                    elif response.status == 401:
-                        error_text = await response.text()
-                        logger.error(f"Unauthorized access to datasets in workspace {workspace_name}: {error_text}")
-                        return []
-                    
-                    elif response.status == 403:
-                        error_text = await response.text()
-                        logger.error(f"Forbidden access to datasets in workspace {workspace_name}: {error_text}")
-                        logger.error("The app may not have access to this workspace's datasets")
-                        return []
+                        # Only include datasets that can be queried
+                        if ds.get("isRefreshable", True) or ds.get("isEffectiveIdentityRequired", False) or True:  # Be more permissive
+                            dataset = DatasetInfo(
+                                id=ds["id"],
+                                name=ds["name"],
+                                workspace_id=workspace_id,
+                                workspace_name=workspace_name or "My Workspace" if workspace_id == "me" else workspace_name,
+                                configured_by=ds.get("configuredBy"),
+                                created_date=ds.get("createdDate"),
+                                content_provider_type=ds.get("contentProviderType")
+                            )
+                            datasets.append(dataset)
+                        else:
+                            logger.info(f"Skipping non-queryable dataset: {ds.get('name', 'Unknown')}")
                     
-                    elif response.status == 404:
-                        logger.error(f"Workspace {workspace_name} not found or not accessible")
-                        return []
+                    logger.info(f"Retrieved {len(datasets)} queryable datasets from workspace {workspace_name}")
+                    return datasets
+                
+                elif response.status == 401:
+                    error_text = await self._read_error_text(response)
+                    logger.error(f"Unauthorized access to datasets in workspace {workspace_name}: {error_text}")
+                    return []
+                
+                elif response.status == 403:
+                    error_text = await self._read_error_text(response)
+                    logger.error(f"Forbidden access to datasets in workspace {workspace_name}: {error_text}")
+                    logger.error("The app may not have access to this workspace's datasets")
+                    return []
+                
+                elif response.status == 404:
+                    logger.error(f"Workspace {workspace_name} not found or not accessible")
+                    return []
+                
+                else:
+                    error_text = await self._read_error_text(response)
+                    logger.error(f"Failed to get datasets: {response.status} - {error_text}")
+                    return []
                     
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get datasets: {response.status} - {error_text}")
-                        return []
-                        
         except Exception as e:
             logger.error(f"Error fetching datasets for workspace {workspace_name}: {e}", exc_info=True)
             return []
@@ -483,10 +638,7 @@ class PowerBIClient:
         try:
             logger.info(f"Fetching metadata for dataset: {dataset_id[:8]}...")
             
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers(access_token)
             
             metadata = {
                 "tables": [],
@@ -495,79 +647,80 @@ class PowerBIClient:
             }
             
             # First, try to get dataset refresh history to understand the model better
-            async with aiohttp.ClientSession() as session:
-                try:
-                    # Get dataset refresh history
-                    async with session.get(
-                        f"{self.base_url}/datasets/{dataset_id}/refreshes",
-                        headers=headers,
-                        params={"$top": 1},
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        
-                        if response.status == 200:
-                            refresh_data = await response.json()
-                            if refresh_data.get("value"):
-                                metadata["last_refresh"] = refresh_data["value"][0].get("endTime")
-                                logger.info(f"Dataset last refreshed: {metadata['last_refresh']}")
-                except Exception as e:
-                    logger.warning(f"Could not get refresh history: {e}")
-                
-                # Execute a metadata query to discover tables and measures
-                metadata_query = """
-                EVALUATE
-                    UNION(
-                        SELECTCOLUMNS(
-                            INFO.TABLES(),
-                            "Type", "Table",
-                            "Name", [Name],
-                            "Description", [Description]
-                        ),
-                        SELECTCOLUMNS(
-                            INFO.MEASURES(),
-                            "Type", "Measure",
-                            "Name", [Name],
-                            "Description", [Description]
-                        )
+            session = self.get_session()
+            try:
+                # Get dataset refresh history
+                async with self._request(
+                    session, "GET",
+                    f"{self.base_url}/datasets/{dataset_id}/refreshes",
+                    headers=headers,
+                    params={"$top": 1},
+                    timeout=PROBE_TIMEOUT
+                ) as response:
+                    
+                    if response.status == 200:
+                        refresh_data = await _read_json(response)
+                        if refresh_data.get("value"):
+                            metadata["last_refresh"] = refresh_data["value"][0].get("endTime")
+                            logger.info(f"Dataset last refreshed: {metadata['last_refresh']}")
+            except Exception as e:
+                logger.warning(f"Could not get refresh history: {e}")
+            
+            # Execute a metadata query to discover tables and measures
+            metadata_query = """
+            EVALUATE
+                UNION(
+                    SELECTCOLUMNS(
+                        INFO.TABLES(),
+                        "Type", "Table",
+                        "Name", [Name],
+                        "Description", [Description]
+                    ),
+                    SELECTCOLUMNS(
+                        INFO.MEASURES(),
+                        "Type", "Measure",
+                        "Name", [Name],
+                        "Description", [Description]
                     )
+                )
+            """
+            
+            # Try to execute metadata query
+            logger.info("Attempting to discover dataset schema using DAX query...")
+            result = await self.execute_dax_query(access_token, dataset_id, metadata_query)
+            
+            if result.success and result.data:
+                for item in result.data:
+                    if item.get("Type") == "Table":
+                        metadata["tables"].append({
+                            "name": item.get("Name", ""),
+                            "description": item.get("Description", "")
+                        })
+                    elif item.get("Type") == "Measure":
+                        metadata["measures"].append({
+                            "name": item.get("Name", ""),
+                            "description": item.get("Description", "")
+                        })
+                
+                logger.info(f"Discovered {len(metadata['tables'])} tables and {len(metadata['measures'])} measures")
+            else:
+                # Fallback: Try simpler queries
+                logger.info("Metadata query failed, using fallback approach")
+                
+                # Try to get at least some basic info
+                simple_query = """
+                EVALUATE
+                ROW("Dataset", "Available")
                 """
                 
-                # Try to execute metadata query
-                logger.info("Attempting to discover dataset schema using DAX query...")
-                result = await self.execute_dax_query(access_token, dataset_id, metadata_query)
-                
-                if result.success and result.data:
-                    for item in result.data:
-                        if item.get("Type") == "Table":
-                            metadata["tables"].append({
-                                "name": item.get("Name", ""),
-                                "description": item.get("Description", "")
-                            })
-                        elif item.get("Type") == "Measure":
-                            metadata["measures"].append({
-                                "name": item.get("Name", ""),
-                                "description": item.get("Description", "")
-                            })
-                    
-                    logger.info(f"Discovered {len(metadata['tables'])} tables and {len(metadata['measures'])} measures")
+                test_result = await self.execute_dax_query(access_token, dataset_id, simple_query)
+                if test_result.success:
+                    metadata["status"] = "accessible"
+                    logger.info("Dataset is accessible for queries")
                 else:
-                    # Fallback: Try simpler queries
-                    logger.info("Metadata query failed, using fallback approach")
-                    
-                    # Try to get at least some basic info
-                    simple_query = """
-                    EVALUATE
-                    ROW("Dataset", "Available")
-                    """
-                    
-                    test_result = await self.execute_dax_query(access_token, dataset_id, simple_query)
-                    if test_result.success:
-                        metadata["status"] = "accessible"
-                        logger.info("Dataset is accessible for queries")
-                    else:
-                        metadata["status"] = "inaccessible"
-                        metadata["error"] = test_result.error
-                        logger.warning(f"Dataset may not be fully accessible: {test_result.error}")
+                    metadata["status"] = "inaccessible"
+                    metadata["error"] = test_result.error
+                    logger.warning(f"Dataset may not be fully accessible: {test_result.error}")
             
             return metadata
             
@@ -577,13 +730,10 @@ class PowerBIClient:
     
     async def execute_dax_query(self, access_token: str, dataset_id: str, dax_query: str, dataset_name: str = "") -> QueryResult:
         """Execute a DAX query against a Power BI dataset"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            }
+            headers = self.get_auth_headers(access_token)
             
             # Prepare the query payload
             payload = {
@@ -599,117 +749,118 @@ class PowerBIClient:
             
             logger.info(f"Executing DAX query on dataset {dataset_name or dataset_id[:8]}: {dax_query[:100]}...")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/datasets/{dataset_id}/executeQueries",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    
-                    execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
-                    
-                    logger.info(f"DAX query response status: {response.status}")
+            session = self.get_session()
+            async with self._request(
+                session, "POST",
+                f"{self.base_url}/datasets/{dataset_id}/executeQueries",
+                headers=headers,
+                json=payload,
+                timeout=QUERY_TIMEOUT
+            ) as response:
+                
+                execution_time = int((time.perf_counter() - start_time) * 1000)
+                
+                logger.info(f"DAX query response status: {response.status}")
+                
+                if response.status == 200:
+                    data = await _read_json(response)
                     
-                    if response.status == 200:
-                        data = await response.json()
+                    # Extract results from the response
+                    if "results" in data and len(data["results"]) > 0:
+                        result = data["results"][0]
                         
-                        # Extract results from the response
-                        if "results" in data and len(data["results"]) > 0:
-                            result = data["results"][0]
+                        if "tables" in result and len(result["tables"]) > 0:
+                            table = result["tables"][0]
+                            rows = table.get("rows", [])
                             
-                            if "tables" in result and len(result["tables"]) > 0:
-                                table = result["tables"][0]
-                                rows = table.get("rows", [])
-                                
-                                # Convert rows to list of dictionaries
-                                formatted_rows = []
-                                for row in rows:
-                                    formatted_rows.append(row)
-                                
-                                logger.info(f"Query successful: {len(formatted_rows)} rows returned in {execution_time}ms")
-                                
-                                return QueryResult(
-                                    success=True,
-                                    data=formatted_rows,
-                                    row_count=len(formatted_rows),
-                                    execution_time_ms=execution_time,
-                                    dataset_id=dataset_id,
-                                    dataset_name=dataset_name
-                                )
-                            else:
-                                # Query executed but no data returned
-                                logger.info("Query executed successfully but returned no data")
-                                return QueryResult(
-                                    success=True,
-                                    data=[],
-                                    row_count=0,
-                                    execution_time_ms=execution_time,
-                                    dataset_id=dataset_id,
-                                    dataset_name=dataset_name
-                                )
+                            # Convert rows to list of dictionaries
+                            formatted_rows = []
+                            for row in rows:
+                                formatted_rows.append(row)
+                            
+                            logger.info(f"Query successful: {len(formatted_rows)} rows returned in {execution_time}ms")
+                            
+                            return QueryResult(
+                                success=True,
+                                data=formatted_rows,
+                                row_count=len(formatted_rows),
+                                execution_time_ms=execution_time,
+                                dataset_id=dataset_id,
+                                dataset_name=dataset_name
+                            )
                         else:
-                            # No results in response
-                            logger.warning("Query response contains no results")
+                            # Query executed but no data returned
+                            logger.info("Query executed successfully but returned no data")
                             return QueryResult(
-                                success=False,
-                                error="No results returned from query",
-                                execution_time_ms=execution_time
+                                success=True,
+                                data=[],
+                                row_count=0,
+                                execution_time_ms=execution_time,
+                                dataset_id=dataset_id,
+                                dataset_name=dataset_name
                             )
-                    
-                    elif response.status == 400:
-                        # Bad request - likely DAX syntax error
-                        error_data = await response.json()
-                        error_message = self._extract_error_message(error_data)
-                        
-                        logger.error(f"DAX syntax error: {error_message}")
-                        
+                    else:
+                        # No results in response
+                        logger.warning("Query response contains no results")
                         return QueryResult(
                             success=False,
-                            error=f"DAX syntax error: {error_message}",
+                            error="No results returned from query",
                             execution_time_ms=execution_time
                         )
+                
+                elif response.status == 400:
+                    # Bad request - likely DAX syntax error
+                    error_data = await _read_json(response)
+                    error_message = self._extract_error_message(error_data)
                     
-                    elif response.status == 401:
-                        # Unauthorized
-                        error_text = await response.text()
-                        logger.error(f"Unauthorized access to dataset: {error_text}")
-                        return QueryResult(
-                            success=False,
-                            error="Unauthorized: Access token may be expired or invalid",
-                            execution_time_ms=execution_time
-                        )
+                    logger.error(f"DAX syntax error: {error_message}")
                     
-                    elif response.status == 403:
-                        # Forbidden
-                        error_text = await response.text()
-                        logger.error(f"Forbidden access to dataset: {error_text}")
-                        return QueryResult(
-                            success=False,
-                            error="Access denied: The app may not have permission to query this dataset",
-                            execution_time_ms=execution_time
-                        )
+                    return QueryResult(
+                        success=False,
+                        error=f"DAX syntax error: {error_message}",
+                        execution_time_ms=execution_time
+                    )
+                
+                elif response.status == 401:
+                    # Unauthorized
+                    error_text = await self._read_error_text(response)
+                    logger.error(f"Unauthorized access to dataset: {error_text}")
+                    return QueryResult(
+                        success=False,
+                        error="Unauthorized: Access token may be expired or invalid",
+                        execution_time_ms=execution_time
+                    )
+                
+                elif response.status == 403:
+                    # Forbidden
+                    error_text = await self._read_error_text(response)
+                    logger.error(f"Forbidden access to dataset: {error_text}")
+                    return QueryResult(
+                        success=False,
+                        error="Access denied: The app may not have permission to query this dataset",
+                        execution_time_ms=execution_time
+                    )
+                
+                elif response.status == 404:
+                    # Dataset not found
+                    logger.error(f"Dataset {dataset_id} not found")
+                    return QueryResult(
+                        success=False,
+                        error=f"Dataset {dataset_id} not found or not accessible",
+                        execution_time_ms=execution_time
+                    )
+                
+                else:
+                    # Other error
+                    error_text = await self._read_error_text(response)
+                    logger.error(f"Query failed with status {response.status}: {error_text}")
                     
-                    elif response.status == 404:
-                        # Dataset not found
-                        logger.error(f"Dataset {dataset_id} not found")
-                        return QueryResult(
-                            success=False,
-                            error=f"Dataset {dataset_id} not found or not accessible",
-                            execution_time_ms=execution_time
-                        )
+                    return QueryResult(
+                        success=False,
+                        error=f"Query failed with status {response.status}: {error_text[:200]}",
+                        execution_time_ms=execution_time
+                    )
                     
-                    else:
-                        # Other error
-                        error_text = await response.text()
-                        logger.error(f"Query failed with status {response.status}: {error_text}")
-                        
-                        return QueryResult(
-                            success=False,
-                            error=f"Query failed with status {response.status}: {error_text[:200]}",
-                            execution_time_ms=execution_time
-                        )
-                        
         except asyncio.TimeoutError:
             logger.error("DAX query timed out after 60 seconds")
             return QueryResult(
@@ -722,7 +873,7 @@ class PowerBIClient:
             return QueryResult(
                 success=False,
                 error=f"Error executing query: {str(e)}",
-                execution_time_ms=int((datetime.now() - start_time).total_seconds() * 1000)
+                execution_time_ms=int((time.perf_counter() - start_time) * 1000)
             )
     
     def _extract_error_message(self, error_data: Dict[str, Any]) -> str:
@@ -792,6 +943,10 @@ class PowerBIClient:
             
             # Try to access API
             try:
+                if not await self.check_api_reachable():
+                    validation_result["errors"].append(f"Power BI API is not reachable at {self.base_url}")
+                    return validation_result
+                
                 workspaces = await self.get_user_workspaces(token)
                 validation_result["api_accessible"] = True
                 
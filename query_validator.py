@@ -1,6 +1,8 @@
 # query_validator.py - Shared Query Validator
 # This shares the validation logic between the bot and Azure Function
 
+import re
+
 class QueryValidator:
     """Validates queries for safety - shared between bot and function"""
     
@@ -16,6 +18,22 @@ class QueryValidator:
         'openrowset', 'openquery', 'opendatasource'
     ]
     
+    # SQL injection patterns to block
+    INJECTION_PATTERNS = [
+        '/*',  # Block comment start
+        '*/',  # Block comment end
+        'xp_', # Extended procedures
+    ]
+    
+    # One regex per list so safe queries are scanned once instead of once per entry
+    _DANGEROUS_RE = re.compile('|'.join(map(re.escape, DANGEROUS_KEYWORDS)))
+    _INJECTION_RE = re.compile('|'.join(map(re.escape, INJECTION_PATTERNS)))
+    
+    # Identifier checks: drop the allowed punctuation in one translate pass, then isalnum()
+    _NAME_PUNCTUATION = str.maketrans('', '', '_-')
+    _TABLE_BRACKETS = str.maketrans('', '', '[]')
+    _DANGEROUS_DB_RE = re.compile(r"drop|delete|exec|;|--|/\*")
+    
     # Safe keywords that might appear in dangerous context but are OK
     SAFE_EXCEPTIONS = {
         'into': ['insert into', 'bulk insert'],  # OK if not in these contexts
@@ -48,30 +66,27 @@ class QueryValidator:
             return False, f"Query must start with one of: {', '.join(QueryValidator.ALLOWED_QUERY_PREFIXES)}"
         
         # Check for dangerous keywords with context awareness
-        for keyword in QueryValidator.DANGEROUS_KEYWORDS:
-            if keyword in query_lower:
-                # Check for safe exceptions
-                if keyword in QueryValidator.SAFE_EXCEPTIONS:
-                    dangerous_contexts = QueryValidator.SAFE_EXCEPTIONS[keyword]
-                    if not any(context in query_lower for context in dangerous_contexts):
-                        continue  # This usage is safe
-                
-                # Special handling for common safe patterns
-                if keyword == 'into' and 'insert' not in query_lower and 'bulk' not in query_lower:
-                    continue  # SELECT INTO temp table is OK
-                
-                return False, f"Query contains forbidden keyword: {keyword}"
+        # (the per-keyword walk only runs when the combined scan finds something)
+        if QueryValidator._DANGEROUS_RE.search(query_lower):
+            for keyword in QueryValidator.DANGEROUS_KEYWORDS:
+                if keyword in query_lower:
+                    # Check for safe exceptions
+                    if keyword in QueryValidator.SAFE_EXCEPTIONS:
+                        dangerous_contexts = QueryValidator.SAFE_EXCEPTIONS[keyword]
+                        if not any(context in query_lower for context in dangerous_contexts):
+                            continue  # This usage is safe
+                    
+                    # Special handling for common safe patterns
+                    if keyword == 'into' and 'insert' not in query_lower and 'bulk' not in query_lower:
+                        continue  # SELECT INTO temp table is OK
+                    
+                    return False, f"Query contains forbidden keyword: {keyword}"
         
         # Check for SQL injection patterns
-        injection_patterns = [
-            '/*',  # Block comment start
-            '*/',  # Block comment end
-            'xp_', # Extended procedures
-        ]
-        
-        for pattern in injection_patterns:
-            if pattern in query_lower:
-                return False, f"Query contains potentially dangerous pattern: {pattern}"
+        if QueryValidator._INJECTION_RE.search(query_lower):
+            for pattern in QueryValidator.INJECTION_PATTERNS:
+                if pattern in query_lower:
+                    return False, f"Query contains potentially dangerous pattern: {pattern}"
         
         # Check for multiple statements (but allow single semicolon at end)
         semicolon_count = query.count(';')
@@ -118,16 +133,12 @@ class QueryValidator:
             return False
         
         # Only allow alphanumeric, underscore, and hyphen
-        if not database.replace('_', '').replace('-', '').isalnum():
+        if not database.translate(QueryValidator._NAME_PUNCTUATION).isalnum():
             return False
         
         # Prevent obvious SQL injection attempts
-        dangerous_db_patterns = ['drop', 'delete', 'exec', ';', '--', '/*']
-        db_lower = database.lower()
-        
-        for pattern in dangerous_db_patterns:
-            if pattern in db_lower:
-                return False
+        if QueryValidator._DANGEROUS_DB_RE.search(database.lower()):
+            return False
         
         return True
     
@@ -138,12 +149,12 @@ class QueryValidator:
             return False
         
         # Allow brackets
-        clean_table = table.replace('[', '').replace(']', '')
+        clean_table = table.translate(QueryValidator._TABLE_BRACKETS)
         
         # Allow schema.table format
         parts = clean_table.split('.')
         for part in parts:
-            if not part.replace('_', '').replace('-', '').isalnum():
+            if not part.translate(QueryValidator._NAME_PUNCTUATION).isalnum():
                 return False
         
         return True
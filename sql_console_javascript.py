@@ -15,6 +15,13 @@ def get_sql_console_javascript():
     let conversationLogs = [];  // Store all logs for export
     let lastErrorAnalysis = null;  // Store last error analysis for reference
 
+    // One formatter for message timestamps; same output as toLocaleTimeString()
+    const TIME_FORMAT = new Intl.DateTimeFormat(undefined, {hour: 'numeric', minute: '2-digit', second: '2-digit'});
+
+    function nowTime() {
+        return TIME_FORMAT.format(new Date());
+    }
+
     // Initialize
     window.onload = async function() {
         await getCurrentUser();
@@ -45,10 +52,71 @@ def get_sql_console_javascript():
         return 'session_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9);
     }
 
+    let scrollPending = false;
+
+    function scheduleScroll() {
+        // Coalesce scroll-to-bottom requests into one layout per frame
+        if (scrollPending) return;
+        scrollPending = true;
+        requestAnimationFrame(() => {
+            const messagesContainer = document.getElementById('messagesContainer');
+            messagesContainer.scrollTop = messagesContainer.scrollHeight;
+            // A row that was skipped off-screen takes its real height once it
+            // is laid out; follow it if the first scroll stopped short
+            requestAnimationFrame(() => {
+                scrollPending = false;
+                if (messagesContainer.scrollTop + messagesContainer.clientHeight < messagesContainer.scrollHeight - 1) {
+                    messagesContainer.scrollTop = messagesContainer.scrollHeight;
+                }
+            });
+        });
+    }
+
+    function appendMessage(messagesContainer, messageDiv) {
+        // Messages sit in full-width rows so off-screen rows can skip layout
+        // without collapsing the content-sized message inside
+        const row = document.createElement('div');
+        row.className = 'message-row';
+        row.appendChild(messageDiv);
+        messagesContainer.appendChild(row);
+    }
+
+    const HTML_ESCAPE_RE = /[&<>"']/g;
+    const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+
     function escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        // String replace instead of a throwaway DOM node per call
+        if (text === null || text === undefined) return '';
+        return String(text).replace(HTML_ESCAPE_RE, c => HTML_ESCAPES[c]);
+    }
+
+    function buildResultTable(rows) {
+        // Built detached with textContent: no HTML parsing and no escaping per cell
+        const columns = Object.keys(rows[0]);
+        const table = document.createElement('table');
+        table.className = 'result-table';
+        
+        const headerRow = table.createTHead().insertRow();
+        for (const col of columns) {
+            const th = document.createElement('th');
+            th.textContent = col;
+            headerRow.appendChild(th);
+        }
+        
+        const tbody = document.createElement('tbody');
+        const fragment = document.createDocumentFragment();
+        for (const row of rows) {
+            const tr = document.createElement('tr');
+            for (const col of columns) {
+                const td = document.createElement('td');
+                td.textContent = row[col] === null ? 'NULL' : String(row[col]);
+                tr.appendChild(td);
+            }
+            fragment.appendChild(tr);
+        }
+        tbody.appendChild(fragment);
+        table.appendChild(tbody);
+        return table;
     }
 
     function handleKeyPress(event) {
@@ -226,7 +294,7 @@ def get_sql_console_javascript():
         const logDiv = document.createElement('div');
         logDiv.className = 'message bot log-message';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         const timestamp = new Date().toISOString();
         
         // Store log for export
@@ -253,8 +321,8 @@ def get_sql_console_javascript():
             </div>
         `;
         
-        messagesContainer.appendChild(logDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, logDiv);
+        scheduleScroll();
     }
 
     async function sendMessage() {
@@ -375,7 +443,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         const analysis = result.error_analysis;
         lastErrorAnalysis = analysis;  // Store for reference
         
@@ -451,8 +519,8 @@ def get_sql_console_javascript():
         `;
         
         messageDiv.innerHTML = content;
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
         
         addLogMessage(`Error analyzed: ${analysis.error_type} - Confidence: ${(analysis.confidence * 100).toFixed(0)}%`, 'info');
     }
@@ -495,11 +563,11 @@ def get_sql_console_javascript():
                 fixedMessage.className = 'message bot';
                 fixedMessage.innerHTML = `
                     <div class="message-content" style="border-left: 3px solid #10b981;">
-                        <div class="message-header">🔧 Fixed Query Result • ${new Date().toLocaleTimeString()}</div>
+                        <div class="message-header">🔧 Fixed Query Result • ${nowTime()}</div>
                         <div class="message-text">The error was fixed and the query executed successfully!</div>
                     </div>
                 `;
-                document.getElementById('messagesContainer').appendChild(fixedMessage);
+                appendMessage(document.getElementById('messagesContainer'), fixedMessage);
                 
                 // Handle the result based on type
                 if (result.response_type === 'sql_result') {
@@ -530,7 +598,7 @@ def get_sql_console_javascript():
             const analysisDiv = document.createElement('div');
             analysisDiv.className = 'message bot';
             
-            const time = new Date().toLocaleTimeString();
+            const time = nowTime();
             
             // Store analyses for button clicks
             window.multiDbErrorAnalyses = {};
@@ -570,8 +638,8 @@ def get_sql_console_javascript():
             `;
             
             analysisDiv.innerHTML = content;
-            messagesContainer.appendChild(analysisDiv);
-            messagesContainer.scrollTop = messagesContainer.scrollHeight;
+            appendMessage(messagesContainer, analysisDiv);
+            scheduleScroll();
         }
     }
 
@@ -635,7 +703,7 @@ def get_sql_console_javascript():
         
         let content = `
             <div class="message-content">
-                <div class="message-header">🔄 Alternative Queries • ${new Date().toLocaleTimeString()}</div>
+                <div class="message-header">🔄 Alternative Queries • ${nowTime()}</div>
                 <div class="message-text">Here are alternative queries that might work:</div>
                 
                 <div style="margin-top: 1rem;">
@@ -658,8 +726,8 @@ def get_sql_console_javascript():
         `;
         
         altDiv.innerHTML = content;
-        messagesContainer.appendChild(altDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, altDiv);
+        scheduleScroll();
     }
 
     // New function to use alternative query
@@ -682,7 +750,7 @@ def get_sql_console_javascript():
         
         let content = `
             <div class="message-content">
-                <div class="message-header">🔍 Discovery Queries • ${new Date().toLocaleTimeString()}</div>
+                <div class="message-header">🔍 Discovery Queries • ${nowTime()}</div>
                 <div class="message-text">These queries can help you find the correct table/column names:</div>
                 
                 <div style="margin-top: 1rem;">
@@ -705,8 +773,8 @@ def get_sql_console_javascript():
         `;
         
         discDiv.innerHTML = content;
-        messagesContainer.appendChild(discDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, discDiv);
+        scheduleScroll();
     }
 
     // New function to run discovery query by index
@@ -747,12 +815,12 @@ def get_sql_console_javascript():
                 
                 resultDiv.innerHTML = `
                     <div class="message-content" style="border-left: 3px solid #6366f1;">
-                        <div class="message-header">🔍 Discovery Result • ${new Date().toLocaleTimeString()}</div>
+                        <div class="message-header">🔍 Discovery Result • ${nowTime()}</div>
                         <div class="message-text">Found ${result.row_count} results in ${result.database}</div>
                     </div>
                 `;
                 
-                messagesContainer.appendChild(resultDiv);
+                appendMessage(messagesContainer, resultDiv);
                 
                 // Show the discovery results
                 handleSingleDbResult(result);
@@ -803,7 +871,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         
         messageDiv.innerHTML = `
             <div class="message-content">
@@ -812,8 +880,8 @@ def get_sql_console_javascript():
             </div>
         `;
         
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     function addSchemaComparisonResult(result) {
@@ -821,7 +889,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         
         let content = `
             <div class="message-content">
@@ -840,8 +908,8 @@ def get_sql_console_javascript():
         content += '</div></div>';
         
         messageDiv.innerHTML = content;
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     function addStandardizationResult(result) {
@@ -849,7 +917,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         
         let content = `
             <div class="message-content">
@@ -869,8 +937,8 @@ def get_sql_console_javascript():
         content += '</div></div>';
         
         messageDiv.innerHTML = content;
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     async function cancelRequest() {
@@ -959,7 +1027,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = `message ${sender}`;
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         const header = sender === 'user' ? 'You' : 'SQL Assistant';
         
         // Store message in logs
@@ -976,8 +1044,8 @@ def get_sql_console_javascript():
             </div>
         `;
         
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     function addSQLResult(result) {
@@ -985,7 +1053,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         
         let content = `
             <div class="message-content">
@@ -1007,26 +1075,8 @@ def get_sql_console_javascript():
                     <div class="sql-query">${escapeHtml(result.sql_query)}</div>
             `;
             
-            if (result.rows && result.rows.length > 0) {
-                // Create table
-                const columns = Object.keys(result.rows[0]);
-                content += '<table class="result-table"><thead><tr>';
-                columns.forEach(col => {
-                    content += `<th>${escapeHtml(col)}</th>`;
-                });
-                content += '</tr></thead><tbody>';
-                
-                result.rows.forEach(row => {
-                    content += '<tr>';
-                    columns.forEach(col => {
-                        const value = row[col] === null ? 'NULL' : String(row[col]);
-                        content += `<td>${escapeHtml(value)}</td>`;
-                    });
-                    content += '</tr>';
-                });
-                
-                content += '</tbody></table>';
-            } else {
+            // A result table is appended as nodes once the markup is in place
+            if (!result.rows || result.rows.length === 0) {
                 content += '<div style="color: #64748b; padding: 1rem;">No results returned</div>';
             }
             
@@ -1036,8 +1086,11 @@ def get_sql_console_javascript():
         content += '</div>';
         
         messageDiv.innerHTML = content;
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        if (result.sql_query && result.rows && result.rows.length > 0) {
+            messageDiv.querySelector('.sql-result').appendChild(buildResultTable(result.rows));
+        }
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     function addMultiDbSQLResult(result) {
@@ -1045,7 +1098,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         
         let content = `
             <div class="message-content">
@@ -1073,28 +1126,10 @@ def get_sql_console_javascript():
             
             if (dbResult.error) {
                 content += `<div class="error-message">❌ ${escapeHtml(dbResult.error)}</div>`;
-            } else if (dbResult.rows && dbResult.rows.length > 0) {
-                // Create table for this database
-                const columns = Object.keys(dbResult.rows[0]);
-                content += '<table class="result-table"><thead><tr>';
-                columns.forEach(col => {
-                    content += `<th>${escapeHtml(col)}</th>`;
-                });
-                content += '</tr></thead><tbody>';
-                
-                dbResult.rows.forEach(row => {
-                    content += '<tr>';
-                    columns.forEach(col => {
-                        const value = row[col] === null ? 'NULL' : String(row[col]);
-                        content += `<td>${escapeHtml(value)}</td>`;
-                    });
-                    content += '</tr>';
-                });
-                
-                content += '</tbody></table>';
-            } else {
+            } else if (!dbResult.rows || dbResult.rows.length === 0) {
                 content += '<div style="color: #64748b; padding: 1rem;">No results returned</div>';
             }
+            // Result tables are appended to their sections as nodes below
             
             content += '</div>';
         });
@@ -1106,8 +1141,14 @@ def get_sql_console_javascript():
         `;
         
         messageDiv.innerHTML = content;
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        const sections = messageDiv.querySelectorAll('.db-result-section');
+        result.multi_db_results.forEach((dbResult, index) => {
+            if (!dbResult.error && dbResult.rows && dbResult.rows.length > 0) {
+                sections[index].appendChild(buildResultTable(dbResult.rows));
+            }
+        });
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     function addErrorMessage(error) {
@@ -1115,7 +1156,7 @@ def get_sql_console_javascript():
         const messageDiv = document.createElement('div');
         messageDiv.className = 'message bot';
         
-        const time = new Date().toLocaleTimeString();
+        const time = nowTime();
         
         messageDiv.innerHTML = `
             <div class="message-content">
@@ -1124,8 +1165,8 @@ def get_sql_console_javascript():
             </div>
         `;
         
-        messagesContainer.appendChild(messageDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, messageDiv);
+        scheduleScroll();
     }
 
     function showTypingIndicator() {
@@ -1142,14 +1183,14 @@ def get_sql_console_javascript():
             </div>
         `;
         
-        messagesContainer.appendChild(typingDiv);
-        messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        appendMessage(messagesContainer, typingDiv);
+        scheduleScroll();
     }
 
     function hideTypingIndicator() {
         const indicator = document.getElementById('typingIndicator');
         if (indicator) {
-            indicator.remove();
+            indicator.closest('.message-row').remove();
         }
     }
 
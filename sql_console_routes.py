@@ -6,18 +6,78 @@ SQL Console Routes - Enhanced with intelligent error handling and query fixing
 import os
 import json
 import logging
+import hashlib
+import re
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from aiohttp import web
 from aiohttp.web import Request, Response, json_response
 import aiohttp
 import asyncio
+from collections import OrderedDict
+
+# Handle orjson import with fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from http_utils import FUNCTION_KEY_RE, compress_variants, variant_etags, variant_response
 
 # Import UI components
-from sql_console_html import get_sql_console_html
+from sql_console_html import (
+    get_sql_console_html,
+    get_sql_console_static_css,
+    get_sql_console_static_javascript,
+    SQL_CONSOLE_CSS_HASH,
+    SQL_CONSOLE_CSS_PATH,
+    SQL_CONSOLE_JS_HASH,
+    SQL_CONSOLE_JS_PATH
+)
 
 logger = logging.getLogger(__name__)
 
+# Timeout for SQL function calls, set once as the console session's default
+_FUNCTION_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Upper bound on error analyses in flight for one multi-database query;
+# the client chooses how many databases it sends
+MAX_CONCURRENT_ANALYSES = 4
+
+async def _read_json(message) -> Any:
+    """Parse a request or client response body as JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        # Parse the raw bytes directly, skipping the bytes -> str decode
+        return orjson.loads(await message.read())
+    return await message.json()
+
+async def _read_error_text(response, limit: int = 4096) -> str:
+    """Read at most limit bytes of an error body; it is only logged and previewed"""
+    try:
+        raw = await response.content.readexactly(limit)
+    except asyncio.IncompleteReadError as e:
+        raw = e.partial
+    return raw.decode('utf-8', errors='replace')
+
+class SessionStore(OrderedDict):
+    """Per-session state that evicts the least recently used sessions past max_items"""
+    
+    def __init__(self, max_items: int):
+        super().__init__()
+        self.max_items = max_items
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_items:
+            self.popitem(last=False)
+
 class SQLConsole:
     """Enhanced SQL Console with error analysis and auto-fixing capabilities"""
     
@@ -28,29 +88,78 @@ class SQLConsole:
         self.active_requests = {}
         self.database_cache = {}
         self.cache_timeout = 300  # 5 minutes
+        # Pooled session for Azure Function calls, created on first use
+        self._session = None
         
-        # Track query history for better context
-        self.query_history = {}  # session_id -> list of recent queries
-        self.error_history = {}  # session_id -> list of recent errors
+        # Track query history for better context, bounded to the most recent sessions
+        max_sessions = int(os.environ.get("CONSOLE_SESSION_LRU", 10000))
+        self.query_history = SessionStore(max_sessions)  # session_id -> list of recent queries
+        self.error_history = SessionStore(max_sessions)  # session_id -> list of recent errors
         
         # Check if authentication is embedded in URL
-        self.url_has_auth = "code=" in self.function_url
+        self.url_has_auth = bool(FUNCTION_KEY_RE.search(self.function_url))
+        
+        # The console page is static: render and compress it once
+        self._page_variants = compress_variants(get_sql_console_html().encode('utf-8'))
+        self._page_etags = variant_etags(
+            self._page_variants,
+            hashlib.sha256(self._page_variants["identity"]).hexdigest()[:16]
+        )
+        self._css_variants = compress_variants(get_sql_console_static_css().encode('utf-8'))
+        self._css_etags = variant_etags(self._css_variants, SQL_CONSOLE_CSS_HASH)
+        self._script_variants = compress_variants(get_sql_console_static_javascript().encode('utf-8'))
+        self._script_etags = variant_etags(self._script_variants, SQL_CONSOLE_JS_HASH)
         
         logger.info(f"SQL Console initialized with error analysis features")
         logger.info(f"Function URL configured: {'Yes' if self.function_url else 'No'}")
         logger.info(f"SQL Translator available: {'Yes' if sql_translator else 'No'}")
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the console's pooled session so function calls reuse their connection"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=_FUNCTION_TIMEOUT,
+                # Every call goes to the one function host: cache its DNS and keep the pool small
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self, app=None):
+        """Close the console's client session, if one was opened"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
     async def console_page(self, request: Request) -> Response:
         """Serve the SQL console HTML page"""
-        html_content = get_sql_console_html()
-        return Response(text=html_content, content_type='text/html')
+        return variant_response(
+            request, self._page_variants, 'text/html',
+            etags=self._page_etags,
+            cache_control="private, max-age=60"
+        )
+    
+    async def console_css(self, request: Request) -> Response:
+        """Serve the console stylesheet; the URL is content-hashed so it never goes stale"""
+        return variant_response(
+            request, self._css_variants, 'text/css',
+            etags=self._css_etags,
+            cache_control="public, max-age=31536000, immutable"
+        )
+    
+    async def console_script(self, request: Request) -> Response:
+        """Serve the console JavaScript; the URL is content-hashed so it never goes stale"""
+        return variant_response(
+            request, self._script_variants, 'application/javascript',
+            etags=self._script_etags,
+            cache_control="public, max-age=31536000, immutable"
+        )
     
     async def handle_message(self, request: Request) -> Response:
         """Handle incoming console messages with enhanced error handling"""
         request_id = datetime.now().strftime("%H%M%S%f")[:10]
+        session_id = None
         
         try:
-            data = await request.json()
+            data = await _read_json(request)
             message = data.get('message', '').strip()
             database = data.get('database', 'demo')
             session_id = data.get('session_id')
@@ -65,7 +174,7 @@ class SQLConsole:
             # Store request for potential cancellation
             self.active_requests[session_id] = request_id
             
-            logger.info(f"[{request_id}] Console message: {message[:50]}...")
+            logger.debug(f"[{request_id}] Console message: {message[:50]}...")
             
             # Send initial acknowledgment
             await self._send_log_message(session_id, f"🔍 Processing: {message}", "info")
@@ -81,6 +190,14 @@ class SQLConsole:
                     'content': self._get_enhanced_help_text()
                 })
             
+            # Everything below needs the SQL function; don't spend translator
+            # calls on a query that can't run
+            if not self.function_url:
+                return json_response({
+                    'status': 'error',
+                    'error': 'Azure Function URL not configured'
+                })
+            
             # Handle schema comparison commands
             if message.lower().startswith('compare schemas'):
                 return await self._handle_schema_comparison(message, databases, session_id)
@@ -222,7 +339,7 @@ class SQLConsole:
     async def apply_error_fix(self, request: Request) -> Response:
         """Apply the suggested fix from error analysis"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             session_id = data.get('session_id')
             fixed_query = data.get('fixed_query')
             database = data.get('database')
@@ -286,7 +403,7 @@ class SQLConsole:
     async def run_discovery_query(self, request: Request) -> Response:
         """Run a discovery query to help find correct table/column names"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             discovery_query = data.get('query')
             database = data.get('database')
             session_id = data.get('session_id')
@@ -346,21 +463,27 @@ class SQLConsole:
     async def _analyze_multi_db_errors(self, errors: List[Dict], query: str, 
                                       user_intent: Optional[str], session_id: str) -> List[Dict]:
         """Analyze errors from multiple databases"""
-        analyses = []
+        failed = [error_result for error_result in errors if error_result.get('error')]
         
-        for error_result in errors:
-            if error_result.get('error'):
-                analysis = await self._analyze_single_error(
+        # Each analysis is an independent translator call; run a few at a time
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        
+        async def analyze(error_result: Dict) -> Dict:
+            async with semaphore:
+                return await self._analyze_single_error(
                     query,
                     error_result['error'],
                     error_result['database'],
                     user_intent,
                     session_id
                 )
-                analysis['database'] = error_result['database']
-                analyses.append(analysis)
         
-        return analyses
+        analyses = await asyncio.gather(*(analyze(error_result) for error_result in failed))
+        
+        for error_result, analysis in zip(failed, analyses):
+            analysis['database'] = error_result['database']
+        
+        return list(analyses)
     
     async def _build_error_context(self, database: str, session_id: str) -> Dict:
         """Build context for error analysis"""
@@ -661,7 +784,7 @@ class SQLConsole:
     
     async def _send_log_message(self, session_id: str, message: str, level: str = "info"):
         """Send a log message to the client"""
-        logger.info(f"[Console-{session_id}] {level.upper()}: {message}")
+        logger.debug(f"[Console-{session_id}] {level.upper()}: {message}")
     
     def _is_sql_query(self, message: str) -> bool:
         """Check if message is a SQL query"""
@@ -683,19 +806,18 @@ class SQLConsole:
         try:
             headers = {"Content-Type": "application/json"}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.function_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Function call failed: {response.status} - {error_text}")
-                        return {'error': f'Function returned {response.status}: {error_text[:200]}'}
+            session = self._get_session()
+            async with session.post(
+                self.function_url,
+                json=payload,
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    return await _read_json(response)
+                else:
+                    error_text = await _read_error_text(response)
+                    logger.error(f"Function call failed: {response.status} - {error_text}")
+                    return {'error': f'Function returned {response.status}: {error_text[:200]}'}
                         
         except Exception as e:
             logger.error(f"Error calling function: {e}")
@@ -898,23 +1020,30 @@ class SQLConsole:
     async def export_logs_api(self, request: Request) -> Response:
         """API endpoint to export conversation logs"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             logs = data.get('logs', [])
             format_type = data.get('format', 'text')
+            # One clock read so the summary entry and the filename agree
+            now = datetime.now()
+            stamp = now.strftime("%Y%m%d_%H%M%S")
             
             # Include error history if available
             session_id = data.get('session_id')
             if session_id and session_id in self.error_history:
                 logs.append({
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'type': 'error_summary',
                     'message': f"Session had {len(self.error_history[session_id])} errors"
                 })
             
             if format_type == 'json':
-                content = json.dumps(logs, indent=2)
+                # Encode straight to bytes; no str round trip through the text codec
+                if ORJSON_AVAILABLE:
+                    content = orjson.dumps(logs, option=orjson.OPT_INDENT_2)
+                else:
+                    content = json.dumps(logs, indent=2).encode('utf-8')
                 content_type = 'application/json'
-                filename = f'sql_console_logs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+                filename = f'sql_console_logs_{stamp}.json'
             else:
                 # Text format
                 lines = []
@@ -924,13 +1053,14 @@ class SQLConsole:
                     message = log.get('message', '')
                     lines.append(f"[{timestamp}] {level}: {message}")
                 
-                content = '\n'.join(lines)
+                content = '\n'.join(lines).encode('utf-8')
                 content_type = 'text/plain'
-                filename = f'sql_console_logs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
+                filename = f'sql_console_logs_{stamp}.txt'
             
             return Response(
-                text=content,
+                body=content,
                 content_type=content_type,
+                charset='utf-8',
                 headers={
                     'Content-Disposition': f'attachment; filename="{filename}"'
                 }
@@ -946,7 +1076,7 @@ class SQLConsole:
     async def cancel_request_api(self, request: Request) -> Response:
         """API endpoint to cancel active request"""
         try:
-            data = await request.json()
+            data = await _read_json(request)
             session_id = data.get('session_id')
             
             if session_id in self.active_requests:
@@ -1006,10 +1136,13 @@ def add_console_routes(app, sql_translator=None):
     """Add SQL console routes to the main app"""
     
     console = SQLConsole(sql_translator)
+    app.on_cleanup.append(console.close)
     
     # Console UI
     app.router.add_get('/console', console.console_page)
     app.router.add_get('/console/', console.console_page)
+    app.router.add_get(SQL_CONSOLE_CSS_PATH, console.console_css)
+    app.router.add_get(SQL_CONSOLE_JS_PATH, console.console_script)
     
     # Console API endpoints
     app.router.add_post('/console/api/message', console.handle_message)
@@ -309,6 +309,18 @@ def get_sql_console_css():
     }
 
     /* Messages */
+    .message-row {
+        display: flex;
+        flex-direction: column;
+    }
+
+    /* Skip layout and paint for rows scrolled out of view; the newest row
+       is always laid out so scroll-to-bottom sees its real height */
+    .message-row:not(:last-child) {
+        content-visibility: auto;
+        contain-intrinsic-block-size: auto 60px;
+    }
+
     .message {
         max-width: 80%;
         animation: fadeIn 0.3s ease-out;
@@ -7,6 +7,7 @@ Combines the best features from both versions with error analysis capability
 import os
 import json
 import logging
+import asyncio
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -252,7 +253,10 @@ Always respond with a JSON object containing:
             
             logger.info(f"Analyzing SQL error: {error_message[:100]}...")
             
-            response = self.client.chat.completions.create(
+            # The client is synchronous: run it off the event loop so the console
+            # stays responsive and concurrent analyses actually overlap
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.deployment_name,
                 messages=messages,
                 temperature=0.2,  # Slightly higher for creative solutions
@@ -43,6 +43,9 @@ mkdir -p .exploration_exports
 mkdir -p .query_logs
 mkdir -p .token_usage
 mkdir -p logs
+mkdir -p .query_history
+mkdir -p .error_logs
+mkdir -p .analyst_cache
 
 # Verify main app loads
 echo "Testing main app import..."
@@ -6,6 +6,7 @@ Run this locally or in Azure to check configuration
 
 import os
 import sys
+import argparse
 import asyncio
 import logging
 from datetime import datetime
@@ -17,9 +18,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def print_block(lines):
+    """Write a block of report lines in one go so client log output can't split it"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 def check_environment_variables():
     """Check if Power BI environment variables are set"""
-    print("\n=== CHECKING ENVIRONMENT VARIABLES ===")
+    lines = ["\n=== CHECKING ENVIRONMENT VARIABLES ==="]
     
     required_vars = {
         "POWERBI_TENANT_ID": "Azure AD Tenant ID",
@@ -34,18 +40,19 @@ def check_environment_variables():
             # Mask sensitive values
             if "SECRET" in var:
                 masked = value[:4] + "***" + value[-4:] if len(value) > 8 else "***"
-                print(f"✓ {var}: {masked} ({description})")
+                lines.append(f"✓ {var}: {masked} ({description})")
             else:
-                print(f"✓ {var}: {value[:20]}... ({description})")
+                lines.append(f"✓ {var}: {value[:20]}... ({description})")
         else:
-            print(f"✗ {var}: NOT SET ({description})")
+            lines.append(f"✗ {var}: NOT SET ({description})")
             all_set = False
     
+    print_block(lines)
     return all_set
 
 def check_imports():
     """Check if all required modules can be imported"""
-    print("\n=== CHECKING IMPORTS ===")
+    lines = ["\n=== CHECKING IMPORTS ==="]
     
     modules_to_check = [
         ("aiohttp", "Web framework"),
@@ -67,25 +74,31 @@ def check_imports():
             else:
                 # Standard library modules
                 __import__(module_name)
-            print(f"✓ {module_name}: Imported successfully ({description})")
+            lines.append(f"✓ {module_name}: Imported successfully ({description})")
         except ImportError as e:
-            print(f"✗ {module_name}: Import failed - {e} ({description})")
+            lines.append(f"✗ {module_name}: Import failed - {e} ({description})")
             all_imported = False
         except Exception as e:
-            print(f"✗ {module_name}: Error - {e} ({description})")
+            lines.append(f"✗ {module_name}: Error - {e} ({description})")
             all_imported = False
     
+    print_block(lines)
     return all_imported
 
-async def test_powerbi_client():
+async def test_powerbi_client(verbose=False):
     """Test Power BI client initialization and basic functionality"""
     print("\n=== TESTING POWER BI CLIENT ===")
     
     try:
         from powerbi_client import powerbi_client
         
+        # The access-level probes only report through INFO logs, which -v turns on
+        if verbose:
+            powerbi_client.diagnostic_probes = True
+        
         # Check if client is configured
         print(f"Client configured: {powerbi_client.is_configured()}")
+        workspaces = []
         
         if powerbi_client.is_configured():
             # Try to get access token
@@ -96,16 +109,23 @@ async def test_powerbi_client():
                 print("✓ Successfully acquired access token")
                 print(f"  Token length: {len(token)} characters")
                 
+                # Make sure the API host answers before running the workspace probes
+                print("\nChecking Power BI API reachability...")
+                if not await powerbi_client.check_api_reachable():
+                    print(f"✗ Power BI API is not reachable at {powerbi_client.base_url}")
+                    print("  Check outbound network access / DNS from this host")
+                    return
+                
                 # Try to get workspaces
                 print("\nAttempting to fetch workspaces...")
                 workspaces = await powerbi_client.get_user_workspaces(token)
                 
                 if workspaces:
-                    print(f"✓ Found {len(workspaces)} accessible workspaces:")
-                    for ws in workspaces[:5]:  # Show first 5
-                        print(f"  - {ws.name} (ID: {ws.id[:8]}...)")
+                    lines = [f"✓ Found {len(workspaces)} accessible workspaces:"]
+                    lines.extend(f"  - {ws.name} (ID: {ws.id[:8]}...)" for ws in workspaces[:5])  # Show first 5
                     if len(workspaces) > 5:
-                        print(f"  ... and {len(workspaces) - 5} more")
+                        lines.append(f"  ... and {len(workspaces) - 5} more")
+                    print_block(lines)
                 else:
                     print("✗ No workspaces found or accessible")
                     print("  Make sure the app registration has been granted access to workspaces")
@@ -115,33 +135,44 @@ async def test_powerbi_client():
         else:
             print("✗ Power BI client is not configured")
             
+        # Full validation repeats the token and workspace calls above,
+        # so only run it when they didn't already succeed
+        if workspaces:
+            print("\n✓ Skipping full validation - workspaces are already accessible")
+            return
+        
         # Run validation
         print("\nRunning full validation...")
         validation = await powerbi_client.validate_configuration()
         
-        print("\nValidation Results:")
-        print(f"  Configured: {validation['configured']}")
-        print(f"  Credentials Present: {validation['credentials_present']}")
-        print(f"  Token Acquired: {validation['token_acquired']}")
-        print(f"  API Accessible: {validation['api_accessible']}")
-        print(f"  Workspaces Accessible: {validation['workspaces_accessible']}")
+        lines = [
+            "\nValidation Results:",
+            f"  Configured: {validation['configured']}",
+            f"  Credentials Present: {validation['credentials_present']}",
+            f"  Token Acquired: {validation['token_acquired']}",
+            f"  API Accessible: {validation['api_accessible']}",
+            f"  Workspaces Accessible: {validation['workspaces_accessible']}"
+        ]
         
         if validation['errors']:
-            print("\n  Errors:")
-            for error in validation['errors']:
-                print(f"    - {error}")
+            lines.append("\n  Errors:")
+            lines.extend(f"    - {error}" for error in validation['errors'])
         
         if validation['warnings']:
-            print("\n  Warnings:")
-            for warning in validation['warnings']:
-                print(f"    - {warning}")
+            lines.append("\n  Warnings:")
+            lines.extend(f"    - {warning}" for warning in validation['warnings'])
+        
+        print_block(lines)
                 
     except Exception as e:
         print(f"✗ Error testing Power BI client: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        from powerbi_client import powerbi_client
+        await powerbi_client.close()
 
-def check_app_routes():
+def check_app_routes(verbose=False):
     """Check if routes can be registered"""
     print("\n=== CHECKING ROUTE REGISTRATION ===")
     
@@ -160,10 +191,11 @@ def check_app_routes():
         analyst_routes = [r for r in test_app.router.routes() if '/analyst' in str(r)]
         
         if analyst_routes:
-            print(f"✓ Successfully registered {len(analyst_routes)} analyst routes:")
-            for route in analyst_routes[:10]:  # Show first 10
-                if hasattr(route, 'resource'):
-                    print(f"  - {route.resource}")
+            print(f"✓ Successfully registered {len(analyst_routes)} analyst routes" + (":" if verbose else ""))
+            if verbose:
+                for route in analyst_routes[:10]:  # Show first 10
+                    if hasattr(route, 'resource'):
+                        print(f"  - {route.resource}")
         else:
             print("✗ No analyst routes were registered")
             
@@ -172,25 +204,27 @@ def check_app_routes():
         import traceback
         traceback.print_exc()
 
-def check_azure_environment():
+def check_azure_environment(verbose=False):
     """Check Azure-specific environment"""
-    print("\n=== CHECKING AZURE ENVIRONMENT ===")
+    lines = ["\n=== CHECKING AZURE ENVIRONMENT ==="]
     
     # Check if running in Azure
     if os.environ.get("WEBSITE_INSTANCE_ID"):
-        print("✓ Running in Azure App Service")
-        print(f"  Instance ID: {os.environ.get('WEBSITE_INSTANCE_ID')}")
-        print(f"  Site Name: {os.environ.get('WEBSITE_SITE_NAME')}")
-        print(f"  Region: {os.environ.get('REGION_NAME', 'Unknown')}")
+        lines.append("✓ Running in Azure App Service")
+        if verbose:
+            lines.append(f"  Instance ID: {os.environ.get('WEBSITE_INSTANCE_ID')}")
+            lines.append(f"  Site Name: {os.environ.get('WEBSITE_SITE_NAME')}")
+            lines.append(f"  Region: {os.environ.get('REGION_NAME', 'Unknown')}")
     else:
-        print("ℹ Running locally (not in Azure)")
+        lines.append("ℹ Running locally (not in Azure)")
     
     # Check Python version
-    print(f"\nPython Version: {sys.version}")
+    lines.append(f"\nPython Version: {sys.version}")
     
     # Check if in production
     deployment_env = os.environ.get("DEPLOYMENT_ENV", "unknown")
-    print(f"Deployment Environment: {deployment_env}")
+    lines.append(f"Deployment Environment: {deployment_env}")
+    print_block(lines)
 
 def print_troubleshooting_steps():
     """Print troubleshooting steps"""
@@ -235,30 +269,46 @@ def print_troubleshooting_steps():
    - Check browser console for JavaScript errors
     """)
 
-async def main():
+async def main(verbose=False):
     """Main troubleshooting function"""
-    print("=" * 60)
-    print("POWER BI ANALYST TROUBLESHOOTING SCRIPT")
-    print(f"Started at: {datetime.now()}")
-    print("=" * 60)
+    print_block([
+        "=" * 60,
+        "POWER BI ANALYST TROUBLESHOOTING SCRIPT",
+        f"Started at: {datetime.now()}",
+        "=" * 60
+    ])
     
     # Run checks
     env_ok = check_environment_variables()
     imports_ok = check_imports()
-    check_azure_environment()
+    check_azure_environment(verbose)
     
     if env_ok and imports_ok:
-        await test_powerbi_client()
-        check_app_routes()
+        await test_powerbi_client(verbose)
+        check_app_routes(verbose)
     else:
         print("\n✗ Cannot proceed with further tests due to missing requirements")
     
     print_troubleshooting_steps()
     
-    print("\n" + "=" * 60)
-    print("TROUBLESHOOTING COMPLETE")
-    print("=" * 60)
+    print_block(["\n" + "=" * 60, "TROUBLESHOOTING COMPLETE", "=" * 60])
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diagnose Power BI Analyst configuration")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="show client INFO logs and full route/instance details")
+    args = parser.parse_args()
+    
+    # The client logs every probe at INFO; keep the default run to the check results
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+    
+    # libuv-backed event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Run the async main function
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(args.verbose))
\ No newline at end of file